@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+import tracemalloc
+
+import numpy as np
+
+import gameoflife
+import packedlife
+
+
+sizes = (64, 256, 1024, 4096, 16384)
+densities = (0.1, 0.3, 0.5)
+seeds = ("glider", "c10orthogonal", "soup")
+
+# Jede Messung läuft mindestens so viele Sekunden, damit auch kleine
+# Spielfelder verlässliche Zeiten liefern.
+min_time = 0.2
+
+
+def _count(grid, n):
+    for _ in range(n):
+        gameoflife.next_step(grid)
+
+def _block(grid, n):
+    for _ in range(n):
+        gameoflife.next_step(grid, method="block")
+
+def _tiled(grid, n):
+    for _ in range(n):
+        gameoflife.next_step(grid, method="tiled")
+
+def _advance(grid, n):
+    gameoflife.advance(grid, n)
+
+def _packed(state, n):
+    packed, w = state
+    for _ in range(n):
+        packedlife.next_step(packed, w)
+
+# Jede Engine: Vorbereitung (nicht gemessen) und n Zeitschritte.
+engines = {
+    "count": (lambda grid: grid, _count),
+    "block": (lambda grid: grid, _block),
+    "tiled": (lambda grid: grid, _tiled),
+    "advance": (lambda grid: grid, _advance),
+    "packed": (lambda grid: (packedlife.pack(grid), grid.shape[1]), _packed),
+}
+
+
+def entities(size, seed, density):
+    """Returns the entities of a standard workload for ``gamegrid``.
+
+    Patterns are placed on a regular lattice whose spacing gives about the
+    requested density of living cells.
+
+    Args:
+        size (int): Side length of the game grid.
+        seed (str): ``"glider"`` or ``"c10orthogonal"``.
+        density (float): The fraction of living cells.
+
+    Returns:
+        List[Tuple[np.ndarray, int, int]]: The entities and their
+        positions.
+    """
+    pattern = getattr(gameoflife, seed)
+    rows, cols = pattern.shape
+    spacing = max(int(round(math.sqrt(pattern.sum() / density))),
+                  rows + 1, cols + 1)
+    return [(pattern, y, x) for y in range(0, size - rows + 1, spacing)
+            for x in range(0, size - cols + 1, spacing)]
+
+def workload(size, seed, density):
+    """Creates the game grid of a standard workload.
+
+    Args:
+        size (int): Side length of the game grid.
+        seed (str): One of ``seeds``. A soup is filled at random with a
+            fixed seed of the random number generator.
+        density (float): The fraction of living cells.
+
+    Returns:
+        np.ndarray: The game grid.
+    """
+    if seed == "soup":
+        return np.random.default_rng(0).random((size, size)) < density
+    return gameoflife.gamegrid(size, size, entities(size, seed, density))
+
+def _place(grid, placed):
+    """Places the entities ``placed`` one by one with ``add_entity``."""
+    for (entity, y, x) in placed:
+        gameoflife.add_entity(grid, entity, y, x)
+    return grid
+
+def _best(function, repeat=3):
+    """Returns the best time of ``repeat`` calls of ``function`` that each
+    run for at least ``min_time`` seconds, and the number of calls per
+    run."""
+    start = time.perf_counter()
+    function()
+    once = time.perf_counter() - start
+    number = max(1, math.ceil(min_time / max(once, 1e-9)))
+
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best, number
+
+def time_engine(engine, grid, repeat=3):
+    """Measures one engine on one game grid.
+
+    Args:
+        engine (str): One of ``engines``.
+        grid (np.ndarray): The game grid. It is updated in place.
+        repeat (int): The number of measurements, of which the best counts.
+
+    Returns:
+        dict: Generations and cells per second and the peak memory the
+        engine allocates during one time step, in bytes.
+    """
+    prepare, run = engines[engine]
+    state = prepare(grid)
+
+    tracemalloc.start()
+    run(state, 1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Mehrere Generationen am Stück, damit advance seine Puffer nutzt.
+    start = time.perf_counter()
+    run(state, 1)
+    once = time.perf_counter() - start
+    generations = max(1, math.ceil(min_time / max(once, 1e-9)))
+    seconds, _ = _best(lambda: run(state, generations), repeat)
+
+    return {"generations_per_second": generations / seconds,
+            "cells_per_second": grid.size * generations / seconds,
+            "peak_bytes": peak}
+
+def run(sizes=sizes, densities=densities, seeds=seeds, names=tuple(engines),
+        repeat=3, progress=None):
+    """Runs the benchmark suite.
+
+    For every size, seed and density the creation of the game grid, once
+    with ``gamegrid`` and once by placing every entity with ``add_entity``,
+    and every engine are measured.
+
+    Args:
+        sizes (Iterable[int]): Side lengths of the game grids.
+        densities (Iterable[float]): Fractions of living cells.
+        seeds (Iterable[str]): Standard seeds, see ``workload``.
+        names (Iterable[str]): Names of the engines, see ``engines``.
+        repeat (int): The number of measurements, of which the best counts.
+        progress (TextIO): A stream for progress messages, or ``None``.
+
+    Returns:
+        dict: The environment and the results, ready to be written as
+        JSON.
+    """
+    results = []
+    for size in sizes:
+        for seed in seeds:
+            for density in densities:
+                key = {"size": size, "seed": seed, "density": density}
+                if seed != "soup":
+                    placed = entities(size, seed, density)
+                    seconds, _ = _best(
+                        lambda: gameoflife.gamegrid(size, size, placed),
+                        repeat)
+                    results.append(dict(key, function="gamegrid",
+                                        seconds=seconds))
+
+                    empty = np.zeros((size, size), dtype=bool)
+                    seconds, _ = _best(lambda: _place(empty, placed),
+                                       repeat)
+                    results.append(dict(key, function="add_entity",
+                                        seconds=seconds))
+
+                for engine in names:
+                    grid = workload(size, seed, density)
+                    result = dict(key, engine=engine,
+                                  **time_engine(engine, grid, repeat))
+                    results.append(result)
+                    if progress:
+                        print("{engine:8s} {size:6d} {seed:14s} {density:.2f}"
+                              "  {cells_per_second:12.4g} cells/s".format(
+                                  **result), file=progress)
+
+    return {"python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "results": results}
+
+def _key(result):
+    return (result.get("engine") or result.get("function"), result["size"],
+            result["seed"], result["density"])
+
+def compare(report, baseline, tolerance=0.25):
+    """Compares a report of ``run`` against an earlier one.
+
+    Args:
+        report (dict): The new report.
+        baseline (dict): The earlier report.
+        tolerance (float): The relative slowdown that is still accepted.
+
+    Returns:
+        List[Tuple[tuple, float]]: The engine or function, size, seed and
+        density of every regression, together with the ratio of new to old
+        speed.
+    """
+    old = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        previous = old.get(_key(result))
+        if previous is None:
+            continue
+        if "cells_per_second" in result:
+            ratio = result["cells_per_second"] / previous["cells_per_second"]
+        else:
+            ratio = previous["seconds"] / result["seconds"]
+        if ratio < 1 - tolerance:
+            regressions.append((_key(result), ratio))
+    return regressions
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the Game of Life engines.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=sizes)
+    parser.add_argument("--densities", type=float, nargs="+",
+                        default=densities)
+    parser.add_argument("--seeds", nargs="+", default=seeds, choices=seeds)
+    parser.add_argument("--engines", nargs="+", default=list(engines),
+                        choices=list(engines))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", default=None,
+                        help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.densities, args.seeds, args.engines,
+                 args.repeat, progress=sys.stderr)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for (key, ratio) in regressions:
+            print("Regression {}: {:.0%} of baseline".format(key, ratio))
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__": main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+
+import os
+import json
+import time
+import functools
+import multiprocessing as mp
+from collections import Counter
+
+import numpy as np
+
+import gameoflife
+import cycles
+
+
+# Bekannte Objekte, nach denen die Codes der Zählung benannt werden.
+_known = {
+    "block": [[1, 1], [1, 1]],
+    "beehive": [[0, 1, 1, 0], [1, 0, 0, 1], [0, 1, 1, 0]],
+    "loaf": [[0, 1, 1, 0], [1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 0]],
+    "boat": [[1, 1, 0], [1, 0, 1], [0, 1, 0]],
+    "ship": [[1, 1, 0], [1, 0, 1], [0, 1, 1]],
+    "tub": [[0, 1, 0], [1, 0, 1], [0, 1, 0]],
+    "pond": [[0, 1, 1, 0], [1, 0, 0, 1], [1, 0, 0, 1], [0, 1, 1, 0]],
+    "blinker": [[1, 1, 1]],
+    "toad": [[0, 1, 1, 1], [1, 1, 1, 0]],
+    "beacon": [[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 1], [0, 0, 1, 1]],
+    "traffic light": [[0, 0, 1, 1, 1, 0, 0], [0, 0, 0, 0, 0, 0, 0],
+                      [1, 0, 0, 0, 0, 0, 1], [1, 0, 0, 0, 0, 0, 1],
+                      [1, 0, 0, 0, 0, 0, 1], [0, 0, 0, 0, 0, 0, 0],
+                      [0, 0, 1, 1, 1, 0, 0]],
+    "glider": gameoflife.glider,
+    "lwss": [[0, 1, 0, 0, 1], [1, 0, 0, 0, 0], [1, 0, 0, 0, 1],
+             [1, 1, 1, 1, 0]],
+}
+_names = None
+_codes = {}
+
+
+def soup(seed, size=16, density=0.5):
+    """Creates a random soup that only depends on ``seed``.
+
+    Args:
+        seed (int): The seed of the random number generator.
+        size (int): Side length of the soup.
+        density (float): The probability of a cell to be alive.
+
+    Returns:
+        np.ndarray: The soup as a numpy-array of type ``bool``.
+    """
+    return np.random.default_rng(seed).random((size, size)) < density
+
+def components(cells, distance=1):
+    """Splits the living cells of ``cells`` into groups. Cells at most
+    ``distance`` cells apart in both directions belong to the same group.
+
+    With a distance of 1 the groups are connected through the eight
+    neighbours of each cell. With a distance of 2, cells of different groups
+    can not have a common neighbour, so the groups do not interact.
+
+    Args:
+        cells (np.ndarray): The game grid or any other array of type
+            ``bool``.
+        distance (int): The maximum distance of connected cells.
+
+    Returns:
+        List[np.ndarray]: The (row, column) coordinates of the cells of each
+        group as an array of shape (n, 2).
+    """
+    coordinates = np.argwhere(cells)
+    positions = [tuple(cell) for cell in coordinates.tolist()]
+    index = {cell: i for (i, cell) in enumerate(positions)}
+    parent = list(range(len(positions)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Jede Zelle mit den schon besuchten Nachbarn vereinigen.
+    offsets = [(drow, dcol) for drow in range(-distance, 1)
+               for dcol in range(-distance, distance + 1)
+               if drow < 0 or dcol < 0]
+    for (i, (row, col)) in enumerate(positions):
+        for (drow, dcol) in offsets:
+            j = index.get((row + drow, col + dcol))
+            if j is not None:
+                parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(len(positions)):
+        groups.setdefault(find(i), []).append(i)
+    return [coordinates[group] for group in groups.values()]
+
+def _crop(cells):
+    """Returns the smallest part of ``cells`` that holds all living cells,
+    together with the position of its upper left corner."""
+    rows = np.flatnonzero(cells.any(axis=1))
+    cols = np.flatnonzero(cells.any(axis=0))
+    if len(rows) == 0:
+        return cells[:0, :0], (0, 0)
+    return (cells[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1],
+            (int(rows[0]), int(cols[0])))
+
+def _extract(coordinates):
+    """Returns the cells at ``coordinates`` as a cropped pattern."""
+    top, left = coordinates.min(axis=0)
+    bottom, right = coordinates.max(axis=0) + 1
+    pattern = np.zeros((bottom - top, right - left), dtype=bool)
+    pattern[coordinates[:, 0] - top, coordinates[:, 1] - left] = True
+    return pattern
+
+def canonical(phases):
+    """Returns a canonical form of an object, the same for all its phases,
+    rotations and reflections.
+
+    Args:
+        phases (List[np.ndarray]): All phases of the object, cropped.
+
+    Returns:
+        Tuple[Tuple[int, int], bytes]: The shape and the packed cells of the
+        smallest of all phases, rotations and reflections.
+    """
+    best = None
+    for phase in phases:
+        for k in range(4):
+            rotated = np.rot90(phase, k)
+            for pattern in (rotated, rotated[::-1]):
+                key = (pattern.shape, np.packbits(pattern).tobytes())
+                if best is None or key < best:
+                    best = key
+    return best
+
+def classify(pattern, max_period=30):
+    """Determines the code of an isolated object.
+
+    The object is run on an empty grid until it reappears. Codes are built
+    like in apgsearch, ``xs`` with the population for still lifes, ``xp``
+    with the period for oscillators and ``xq`` with the period for
+    spaceships, followed by the canonical form of the object.
+
+    Args:
+        pattern (np.ndarray): The object.
+        max_period (int): The maximum period that is detected.
+
+    Returns:
+        Optional[str]: The code, or ``None`` if the object did not reappear
+        within ``max_period`` time steps.
+    """
+    pattern = _crop(pattern)[0]
+    key = (pattern.shape, np.packbits(pattern).tobytes())
+    if key in _codes:
+        return _codes[key]
+
+    rows, cols = pattern.shape
+    margin = max_period + 2
+    grid = np.zeros((rows + 2 * margin, cols + 2 * margin), dtype=bool)
+    grid[margin:margin + rows, margin:margin + cols] = pattern
+
+    code = None
+    phases = [pattern]
+    for period in range(1, max_period + 1):
+        phase, corner = _crop(gameoflife.next_step(grid))
+        if np.array_equal(phase, pattern):
+            if corner != (margin, margin):
+                kind, number = "q", period
+            elif period == 1:
+                kind, number = "s", int(np.count_nonzero(pattern))
+            else:
+                kind, number = "p", period
+            (shape, data) = canonical(phases)
+            code = "x{}{}_{}x{}_{}".format(kind, number, shape[0], shape[1],
+                                           data.hex())
+            break
+        phases.append(phase.copy())
+
+    _codes[key] = code
+    return code
+
+def name(code):
+    """Returns the common name of the object with code ``code``, or the code
+    itself if the object has no known name."""
+    global _names
+    if _names is None:
+        _names = {classify(np.array(pattern, dtype=bool)): known
+                  for (known, pattern) in _known.items()}
+    return _names.get(code, code)
+
+def _remove_escapees(grid, margin, objects):
+    """Removes spaceships that reached the frame of width ``margin`` along
+    the border of the grid and counts them in ``objects``.
+
+    Returns:
+        Tuple[bool, bool]: Whether a spaceship was removed, and whether
+        other living cells are left in the frame.
+    """
+    rows, cols = grid.shape
+    inner = grid[margin:-margin, margin:-margin]
+    if np.count_nonzero(inner) == np.count_nonzero(grid):
+        return False, False
+
+    removed = overflow = False
+    for coordinates in components(grid, 2):
+        top, left = coordinates.min(axis=0)
+        bottom, right = coordinates.max(axis=0) + 1
+        if (margin <= top and bottom <= rows - margin and margin <= left
+                and right <= cols - margin):
+            continue
+        # Objekte, die gerade über den Rand laufen, sind nicht mehr sicher
+        # zu erkennen.
+        code = None
+        if top > 0 and left > 0 and bottom < rows and right < cols:
+            code = classify(_extract(coordinates))
+        if code is not None and code.startswith("xq"):
+            grid[coordinates[:, 0], coordinates[:, 1]] = False
+            objects[code] += 1
+            removed = True
+        else:
+            overflow = True
+    return removed, overflow
+
+def _count_objects(grid, period, objects):
+    """Separates the objects of a grid that repeats every ``period``
+    generations and counts their codes in ``objects``."""
+    phases = []
+    union = np.zeros_like(grid)
+    for _ in range(period):
+        phases.append(grid.copy())
+        union |= grid
+        gameoflife.next_step(grid)
+
+    # Über alle Phasen vereinigt hängen auch Oszillatoren zusammen, deren
+    # einzelne Phasen in mehrere Teile zerfallen. Objekte mit gemeinsamen
+    # Nachbarzellen beeinflussen sich und werden daher nicht getrennt.
+    for coordinates in components(union, 2):
+        top, left = coordinates.min(axis=0)
+        bottom, right = coordinates.max(axis=0) + 1
+        mask = _extract(coordinates)
+        pattern = phases[0][top:bottom, left:right] & mask
+        code = classify(pattern, max(30, period)) if pattern.any() else None
+        objects[code or "unknown"] += 1
+
+def run_soup(seed, size=16, board=160, max_steps=5000, max_period=120,
+             interval=16, margin=16, max_board=1280):
+    """Runs a random soup until it stabilises and counts the resulting
+    objects.
+
+    The soup is placed in the middle of a toroidal grid. Every ``interval``
+    generations, spaceships in the frame along the border are counted and
+    removed, so they can not wrap around and hit the remains of the soup.
+    Any other living cells in the frame mean that the soup has grown too
+    large for the grid and would soon collide with itself across the
+    border. The grid is then placed in the middle of one of twice the size,
+    up to ``max_board``; beyond that the soup is counted as ``"overflow"``.
+    As no cell moves faster than one cell per generation, ``interval`` must
+    not exceed ``margin``, so no cell can have crossed the border between
+    two checks. The soup is stable as soon as the grid repeats an earlier
+    state, see ``cycles.find_cycle``.
+
+    Args:
+        seed (int): The seed of the soup, see ``soup``.
+        size (int): Side length of the soup.
+        board (int): Side length of the game grid.
+        max_steps (int): The maximum number of time steps.
+        max_period (int): The maximum period of the stable state.
+        interval (int): The number of generations between two searches for
+            escaping spaceships.
+        margin (int): Width of the frame in which spaceships are removed.
+        max_board (int): The maximum side length of the game grid.
+
+    Returns:
+        Counter: The number of objects of each code. Soups that do not
+        stabilise within ``max_steps`` time steps only count as
+        ``"unstable"``, soups that reach the frame as ``"overflow"``.
+    """
+    if interval > margin:
+        raise ValueError("The interval must not exceed the margin.")
+    offset = (board - size) // 2
+    grid = gameoflife.gamegrid(board, board, [(soup(seed, size), offset,
+                                               offset)])
+    objects = Counter()
+    table = cycles.StateTable(max_period)
+
+    for generation in range(max_steps + 1):
+        start = table.add(cycles.state_hash(grid), generation)
+        if generation % interval == 0 or start is not None:
+            (removed, overflow) = _remove_escapees(grid, margin, objects)
+            if overflow and 2 * len(grid) > max_board:
+                return Counter(overflow=1)
+            if overflow:
+                # Noch hat sich nichts über den Rand hinweg beeinflusst,
+                # daher geht es auf einem doppelt so großen Feld genauso
+                # weiter.
+                grid = np.pad(grid, len(grid) // 2)
+                removed = True
+            if removed:
+                table.clear()
+                table.add(cycles.state_hash(grid), generation)
+                start = None
+
+        if start is not None:
+            _count_objects(grid, generation - start, objects)
+            return objects
+        gameoflife.next_step(grid)
+
+    return Counter(unstable=1)
+
+def _census_soup(seed, **options):
+    return seed, run_soup(seed, **options)
+
+def _save(path, counts, done):
+    """Writes the state of a census atomically to ``path``."""
+    with open(path + ".tmp", "w") as f:
+        json.dump({"done": sorted(done), "counts": counts}, f)
+    os.replace(path + ".tmp", path)
+
+def census(seeds, processes=None, path=None, save_every=100, **options):
+    """Runs many soups in a pool of worker processes and adds up their
+    objects.
+
+    Results are merged as soon as a soup is finished. If ``path`` is given,
+    the merged counts and the finished seeds are saved every ``save_every``
+    soups, and a census started again with the same ``path`` continues
+    where the last one stopped, so a crash loses little work.
+
+    Args:
+        seeds (Iterable[int]): The seeds of the soups.
+        processes (int): The number of worker processes, the number of CPUs
+            by default.
+        path (str): Path of a JSON file holding the state of the census.
+        save_every (int): The number of soups between two saves.
+        options: Further arguments of ``run_soup``.
+
+    Returns:
+        Counter: The number of objects of each code over all soups.
+    """
+    counts = Counter()
+    done = set()
+    if path and os.path.exists(path):
+        with open(path) as f:
+            state = json.load(f)
+        counts.update(state["counts"])
+        done.update(state["done"])
+
+    todo = [seed for seed in seeds if seed not in done]
+    with mp.Pool(processes) as pool:
+        results = pool.imap_unordered(
+            functools.partial(_census_soup, **options), todo, chunksize=4)
+        for (finished, (seed, objects)) in enumerate(results, 1):
+            counts.update(objects)
+            done.add(seed)
+            if path and finished % save_every == 0:
+                _save(path, counts, done)
+
+    if path:
+        _save(path, counts, done)
+    return counts
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    soups = 100
+    start = time.perf_counter()
+    counts = census(range(soups))
+    elapsed = time.perf_counter() - start
+    print("{:.1f} soups/s".format(soups / elapsed))
+    for (code, count) in counts.most_common(15):
+        print("{:8d}  {}".format(count, name(code)))
+
+if __name__ == "__main__": main()
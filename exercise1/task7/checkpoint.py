@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+import zlib
+import struct
+
+import numpy as np
+
+import gameoflife
+
+
+# Kopf einer Sicherungsdatei: Kennung, Version, Kompression, Zeilen,
+# Spalten, Generation und Länge der Regel, danach folgt die Regel selbst.
+magic = b"GOLC"
+version = 1
+_header = struct.Struct("<4sBBxxQQQH")
+
+# Anzahl der Zellen, die beim Packen und Entpacken gleichzeitig bearbeitet
+# werden. Begrenzt den zusätzlichen Speicherbedarf.
+band_cells = 1 << 24
+
+
+def _bands(rows, cols):
+    """Splits ``rows`` rows into bands of about ``band_cells`` cells."""
+    step = max(1, band_cells // max(1, cols))
+    return [(top, min(top + step, rows)) for top in range(0, rows, step)]
+
+def _unpack(packed, rows, cols):
+    """Unpacks ``rows`` packed rows of ``cols`` cells each."""
+    return np.unpackbits(packed.reshape(rows, -1), axis=1, count=cols,
+                         bitorder="little").view(bool)
+
+def save(path, grid, generation=0, rule=gameoflife.conway, compress=False,
+         level=1):
+    """Saves the game grid ``grid`` as a checkpoint file.
+
+    The cells are stored with one bit per cell, row by row, with the least
+    significant bit first and every row padded to whole bytes.
+
+    Args:
+        path (str): Path of the checkpoint file.
+        grid (np.ndarray): The game grid.
+        generation (int): The generation of the game grid.
+        rule (gameoflife.Rule): The rule the game grid is run with.
+        compress (bool): If ``True``, the cells are compressed with zlib.
+        level (int): The zlib compression level. The default favours speed.
+    """
+    rows, cols = grid.shape
+    rule_name = str(rule).encode()
+
+    with open(path, "wb") as f:
+        f.write(_header.pack(magic, version, int(compress), rows, cols,
+                             generation, len(rule_name)))
+        f.write(rule_name)
+
+        compressor = zlib.compressobj(level) if compress else None
+        for (top, bottom) in _bands(rows, cols):
+            data = np.packbits(grid[top:bottom], axis=1,
+                               bitorder="little").tobytes()
+            f.write(compressor.compress(data) if compress else data)
+        if compress:
+            f.write(compressor.flush())
+
+def load(path, mmap=True):
+    """Loads a game grid from a checkpoint file written by ``save``.
+
+    The cells are unpacked band by band straight into the resulting grid.
+    Uncompressed files are memory-mapped, so apart from the grid itself no
+    copy of the file is held in memory.
+
+    Args:
+        path (str): Path of the checkpoint file.
+        mmap (bool): If ``False``, uncompressed files are read in bands
+            instead of being memory-mapped.
+
+    Returns:
+        Tuple[np.ndarray, int, gameoflife.Rule]: The game grid together with
+        its generation and rule.
+    """
+    with open(path, "rb") as f:
+        (kind, file_version, compressed, rows, cols, generation,
+         rule_length) = _header.unpack(f.read(_header.size))
+        if kind != magic or file_version != version:
+            raise ValueError("{} is no checkpoint file.".format(path))
+        rule = gameoflife.Rule.parse(f.read(rule_length).decode())
+
+        offset = _header.size + rule_length
+        row_bytes = -(-cols // 8)
+        grid = np.empty((rows, cols), dtype=bool)
+
+        if grid.size == 0:
+            pass
+        elif compressed:
+            decompressor = zlib.decompressobj()
+            pending = b""
+            for (top, bottom) in _bands(rows, cols):
+                size = (bottom - top) * row_bytes
+                while len(pending) < size:
+                    # Nie mehr als ein Band auf einmal entpacken.
+                    chunk = decompressor.unconsumed_tail or f.read(1 << 20)
+                    if not chunk:
+                        raise ValueError("{} is truncated.".format(path))
+                    pending += decompressor.decompress(chunk,
+                                                       size - len(pending))
+                packed = np.frombuffer(pending, np.uint8, size)
+                grid[top:bottom] = _unpack(packed, bottom - top, cols)
+                pending = pending[size:]
+        elif mmap:
+            packed = np.memmap(f, np.uint8, "r", offset, (rows, row_bytes))
+            for (top, bottom) in _bands(rows, cols):
+                grid[top:bottom] = _unpack(packed[top:bottom],
+                                           bottom - top, cols)
+            del packed
+        else:
+            for (top, bottom) in _bands(rows, cols):
+                packed = np.frombuffer(f.read((bottom - top) * row_bytes),
+                                       np.uint8)
+                grid[top:bottom] = _unpack(packed, bottom - top, cols)
+
+    return grid, generation, rule
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(40, 40, [(gameoflife.glider, 13, 4),
+                                        (gameoflife.c10orthogonal, 25, 25)])
+    save("gameoflife.ckpt", grid, 0, compress=True)
+    restored, generation, rule = load("gameoflife.ckpt")
+    print(np.array_equal(grid, restored), generation, rule)
+
+if __name__ == "__main__": main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+from collections import deque
+
+import numpy as np
+
+import gameoflife
+
+
+def state_hash(grid):
+    """Computes a 64-bit hash of the game grid ``grid``.
+
+    The grid is packed to one bit per cell first, so hashing reads only an
+    eighth of the memory of the grid itself.
+
+    Args:
+        grid (np.ndarray): The game grid.
+
+    Returns:
+        int: The hash value.
+    """
+    return hash((grid.shape, np.packbits(grid).tobytes()))
+
+class StateTable:
+    """Remembers the hashes of the last ``max_period`` generations.
+
+    Args:
+        max_period (int): The number of generations kept in the table.
+    """
+
+    def __init__(self, max_period):
+        self.max_period = max_period
+        self.seen = {}
+        self.order = deque()
+
+    def add(self, key, generation):
+        """Looks up the hash ``key`` of generation ``generation`` and
+        remembers it if it is new.
+
+        Args:
+            key (int): The hash of the game grid, see ``state_hash``.
+            generation (int): The number of the generation.
+
+        Returns:
+            Optional[int]: The generation with the same hash, or ``None`` if
+            there is none among the last ``max_period`` generations.
+        """
+        start = self.seen.get(key)
+        if start is not None:
+            return start
+
+        self.seen[key] = generation
+        self.order.append(key)
+        if len(self.order) > self.max_period:
+            del self.seen[self.order.popleft()]
+        return None
+
+    def clear(self):
+        """Forgets all generations."""
+        self.seen.clear()
+        self.order.clear()
+
+def find_cycle(grid, max_steps, max_period=1000, step=gameoflife.next_step):
+    """Updates the game grid ``grid`` until it repeats an earlier state.
+
+    The hashes of the last ``max_period`` generations are kept in a table,
+    so every cycle with a period of at most ``max_period`` is detected as
+    soon as it is completed for the first time. Still lifes are cycles with
+    period 1, extinct grids as well.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        max_steps (int): The maximum number of time steps.
+        max_period (int): The number of generations kept in the table.
+        step (Callable[[np.ndarray], np.ndarray]): The function that
+            updates the game grid by one time step.
+
+    Returns:
+        Optional[Tuple[int, int]]: The generation in which the cycle starts
+        together with its period, or ``None`` if no cycle was found within
+        ``max_steps`` time steps. In the first case ``grid`` holds the state
+        of generation ``start + period``, which equals the one of generation
+        ``start``.
+    """
+    table = StateTable(max_period)
+    table.add(state_hash(grid), 0)
+
+    for generation in range(1, max_steps + 1):
+        start = table.add(state_hash(step(grid)), generation)
+        if start is not None:
+            return start, generation - start
+
+    return None
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(40, 40, [(gameoflife.glider, 13, 4),
+                                        (gameoflife.c10orthogonal, 25, 25)])
+    print(find_cycle(grid, 10000))
+
+if __name__ == "__main__": main()
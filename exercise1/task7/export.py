@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import sys
+import zlib
+import struct
+import argparse
+
+import numpy as np
+
+import gameoflife
+
+
+# Palette der exportierten Bilder wie in gameoflife(): tote Zellen weiß,
+# lebende Zellen schwarz.
+palette = [(255, 255, 255), (0, 0, 0)]
+
+
+def frames(grid, steps, step=gameoflife.next_step):
+    """Yields the game grid ``grid`` and the following ``steps`` generations.
+
+    The same array is yielded every time, so consumers have to copy it if
+    they want to keep a frame.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        steps (int): The number of time steps.
+        step (Callable[[np.ndarray], np.ndarray]): The function that
+            updates the game grid by one time step.
+
+    Yields:
+        np.ndarray: The game grid of generation 0 to ``steps``.
+    """
+    yield grid
+    for _ in range(steps):
+        yield step(grid)
+
+def _png_chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data)))
+
+def encode_png(grid, level=6):
+    """Encodes the game grid ``grid`` as palette-indexed PNG image with one
+    bit per cell.
+
+    Args:
+        grid (np.ndarray): The game grid.
+        level (int): The zlib compression level.
+
+    Returns:
+        bytes: The PNG file.
+    """
+    rows, cols = grid.shape
+
+    # Jede Zeile beginnt mit dem Filtertyp 0, danach folgen die Zellen
+    # mit dem höchstwertigen Bit zuerst.
+    scanlines = np.zeros((rows, 1 + -(-cols // 8)), dtype=np.uint8)
+    scanlines[:, 1:] = np.packbits(grid, axis=1)
+
+    header = struct.pack(">IIBBBBB", cols, rows, 1, 3, 0, 0, 0)
+    colours = bytes(channel for colour in palette for channel in colour)
+    return (b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"PLTE", colours)
+            + _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), level))
+            + _png_chunk(b"IEND", b""))
+
+def export_png(grid, steps, pattern="frame_{:05d}.png",
+               step=gameoflife.next_step):
+    """Writes the game grid ``grid`` and the following ``steps`` generations
+    as a sequence of PNG images.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        steps (int): The number of time steps.
+        pattern (str): The file name of each image, formatted with the
+            number of the generation.
+        step (Callable[[np.ndarray], np.ndarray]): The function that
+            updates the game grid by one time step.
+    """
+    for (generation, frame) in enumerate(frames(grid, steps, step)):
+        with open(pattern.format(generation), "wb") as f:
+            f.write(encode_png(frame))
+
+def export_gif(grid, steps, path, duration=50, step=gameoflife.next_step):
+    """Writes the game grid ``grid`` and the following ``steps`` generations
+    as an animated GIF.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        steps (int): The number of time steps.
+        path (str): The file name of the GIF.
+        duration (int): The display time of each frame in milliseconds.
+        step (Callable[[np.ndarray], np.ndarray]): The function that
+            updates the game grid by one time step.
+    """
+    # Pillow wird ohnehin von Matplotlib benötigt.
+    from PIL import Image
+
+    colours = [channel for colour in palette for channel in colour]
+
+    def image(frame):
+        picture = Image.fromarray(frame.view(np.uint8), mode="P")
+        picture.putpalette(colours)
+        return picture
+
+    images = (image(frame) for frame in frames(grid, steps, step))
+    first = next(images)
+    first.save(path, save_all=True, append_images=images, duration=duration,
+               loop=0, optimize=False)
+
+def export_raw(grid, steps, stream=None, step=gameoflife.next_step):
+    """Writes the game grid ``grid`` and the following ``steps`` generations
+    as raw frames to ``stream``.
+
+    Each frame consists of the rows of the grid, packed to one bit per cell
+    with the most significant bit first and padded to whole bytes.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        steps (int): The number of time steps.
+        stream (BinaryIO): The output stream, the standard output by default.
+        step (Callable[[np.ndarray], np.ndarray]): The function that
+            updates the game grid by one time step.
+    """
+    stream = stream or sys.stdout.buffer
+    for frame in frames(grid, steps, step):
+        stream.write(np.packbits(frame, axis=1).tobytes())
+    stream.flush()
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    parser = argparse.ArgumentParser(
+        description="Exports Game of Life generations without a display.")
+    parser.add_argument("format", choices=["png", "gif", "raw"])
+    parser.add_argument("steps", type=int)
+    parser.add_argument("--output", default=None,
+                        help="GIF file or PNG file pattern")
+    parser.add_argument("--size", type=int, default=40)
+    args = parser.parse_args()
+
+    grid = gameoflife.gamegrid(args.size, args.size,
+                               [(gameoflife.glider, 13, 4),
+                                (gameoflife.c10orthogonal, 25, 25)])
+    if args.format == "png":
+        export_png(grid, args.steps, args.output or "frame_{:05d}.png")
+    elif args.format == "gif":
+        export_gif(grid, args.steps, args.output or "gameoflife.gif")
+    else:
+        export_raw(grid, args.steps)
+
+if __name__ == "__main__": main()
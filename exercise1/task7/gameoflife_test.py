@@ -14,6 +14,8 @@ import ast
 import pprint
 import importlib.util
 import time
+import shutil
+import tempfile
 import math
 import numbers
 
@@ -375,6 +377,8 @@ def report():
 if __name__ == "__main__":
     mp.freeze_support()
     timeout = 2 * compute_process_spawn_time() + 9
+    # Ordner für Dateien, die die Tests schreiben und wieder lesen.
+    scratch = tempfile.mkdtemp()
 
     ###############################
     ## Nun die eigentlichen Checks
@@ -387,6 +391,18 @@ if __name__ == "__main__":
                   np.array([[1]], dtype=bool)),
                  (("add_entity", np.array([[0, 0, 0], [0, 0, 0]], dtype=bool), np.array([[1]], dtype=bool), 0, 1),
                   np.array([[0, 1, 0], [0, 0, 0]], dtype=bool)),
+                 (("add_entity", np.array([[1, 1, 0], [0, 1, 0]], dtype=bool), np.array([[0, 1], [0, 1]], dtype=bool),
+                   0, 1),
+                  np.array([[1, 0, 1], [0, 0, 1]], dtype=bool)),
+                 (("add_entity", np.array([[1, 1, 0], [0, 1, 0]], dtype=bool), np.array([[0, 1], [0, 1]], dtype=bool),
+                   0, 1, "'or'"),
+                  np.array([[1, 1, 1], [0, 1, 1]], dtype=bool)),
+                 (("add_entity", np.array([[1, 1, 0], [0, 1, 0]], dtype=bool), np.array([[0, 1], [0, 1]], dtype=bool),
+                   0, 1, "'xor'"),
+                  np.array([[1, 1, 1], [0, 1, 1]], dtype=bool)),
+                 (("add_entity", np.array([[1, 1, 1], [0, 1, 0]], dtype=bool), np.array([[1, 1], [1, 1]], dtype=bool),
+                   0, 1, "'xor'"),
+                  np.array([[1, 0, 0], [0, 0, 1]], dtype=bool)),
              ])
 
     register("b", "Aufgabe 2b: Zeitschritt", 3, "gameoflife",
@@ -414,7 +430,363 @@ if __name__ == "__main__":
                   np.array([[0, 0, 0, 0], [0, 1, 0, 1], [1, 0, 0, 0], [1, 0, 0, 0]], dtype=bool)),
                  (("next_step", np.array([[0, 0, 0, 0], [0, 1, 0, 1], [1, 0, 0, 0], [1, 0, 0, 0]], dtype=bool)),
                   np.array([[1, 0, 0, 0], [1, 0, 0, 0], [1, 1, 0, 1], [0, 0, 0, 0]], dtype=bool)),
+                 (("next_step", np.array([[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0]], dtype=bool)),
+                  np.array([[1, 0, 0, 0, 0], [1, 0, 1, 0, 0], [1, 0, 1, 0, 0]], dtype=bool)),
              ])
 
-    check_from_cmdline()
-    report()
+    register("c", "Aufgabe 7c: Nachbarn zählen", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("neighbours", np.array([[1]], dtype=bool)), np.array([[8]], dtype=np.uint8)),
+                 (("neighbours", np.array([[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0]], dtype=bool)),
+                  np.array([[3, 4, 4, 2, 1], [3, 5, 3, 2, 1], [2, 4, 3, 2, 1]], dtype=np.uint8)),
+                 (("padded_step", np.array([[0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0], [0, 0, 0, 0]], dtype=bool)),
+                  np.array([[0, 1], [1, 1]], dtype=bool)),
+             ])
+
+    register("d", "Aufgabe 7d: Bitgepacktes Spielfeld", 1, "packedlife",
+             imports=["numpy", "gameoflife"],
+             calls=[
+                 (("unpack", "pack(np.array([[0, 1, 0, 0, 1]], dtype=bool))", 5),
+                  np.array([[0, 1, 0, 0, 1]], dtype=bool)),
+                 (("unpack", "next_step(pack(np.array([[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0]], dtype=bool)), 5)", 5),
+                  np.array([[1, 0, 0, 0, 0], [1, 0, 1, 0, 0], [1, 0, 1, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "unpack(next_step(pack(np.tri(9, 130, 60, dtype=bool)), 130), 130)",
+                   "gameoflife.next_step(np.tri(9, 130, 60, dtype=bool))"), True),
+             ])
+
+    register("e", "Aufgabe 7e: HashLife", 1, "hashlife",
+             imports=["numpy", "gameoflife"],
+             calls=[
+                 (("advance", np.array([[1]], dtype=bool), 1), np.array([[0]], dtype=bool)),
+                 (("advance", np.array([[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]], dtype=bool), 2),
+                  np.array([[1, 0, 1, 0], [1, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 0]], dtype=bool)),
+                 (("advance", np.array([[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]], dtype=bool), 1024),
+                  np.array([[0, 0, 0, 0], [0, 1, 0, 1], [1, 0, 0, 0], [1, 0, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "advance(gameoflife.gamegrid(32, 32, [(gameoflife.glider, 3, 4)]), 64)",
+                   "gameoflife.gamegrid(32, 32, [(gameoflife.glider, 19, 20)])"), True),
+             ])
+
+    register("f", "Aufgabe 7f: Aktive Kacheln", 1, "tiledlife",
+             imports=["numpy", "gameoflife"],
+             calls=[
+                 (("next_steps", np.array([[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]], dtype=bool), 2, 3),
+                  np.array([[1, 0, 1, 0], [1, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "next_steps(gameoflife.gamegrid(70, 50, [(gameoflife.glider, 45, 60)]), 40, 16)",
+                   "gameoflife.gamegrid(70, 50, [(gameoflife.glider, 5, 0)])"), True),
+             ])
+
+    register("g", "Aufgabe 7g: Parallele Streifen", 1, "parallellife",
+             imports=["numpy", "gameoflife", "time", "threading", "multiprocessing"],
+             calls=[
+                 (("strips", 10, 3), [(0, 3), (3, 6), (6, 10)]),
+                 (("strips", 2, 4), [(0, 1), (1, 2)]),
+                 (("next_steps", np.array([[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]], dtype=bool), 2, 3),
+                  np.array([[1, 0, 1, 0], [1, 0, 1, 0], [1, 0, 0, 0], [0, 0, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "next_steps(gameoflife.gamegrid(30, 40, [(gameoflife.glider, 35, 25)]), 20, 4)",
+                   "gameoflife.gamegrid(30, 40, [(gameoflife.glider, 0, 0)])"), True),
+             ])
+
+    register("h", "Aufgabe 7h: Stapelverarbeitung", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("next_steps_batch", np.array([[[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]],
+                                                 [[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]], dtype=bool),
+                   3, True),
+                  np.array([3, 1])),
+                 (("next_steps_batch", np.zeros((3, 2, 2), dtype=bool), 5), np.array([5, 5, 5])),
+                 (("np.array_equal", "next_step(np.stack([np.eye(5, dtype=bool), np.tri(5, dtype=bool)]))",
+                   "np.stack([next_step(np.eye(5, dtype=bool)), next_step(np.tri(5, dtype=bool))])"), True),
+             ])
+
+    register("i", "Aufgabe 7i: Zyklenerkennung", 1, "cycles",
+             imports=["numpy", "gameoflife", "collections"],
+             calls=[
+                 (("find_cycle", np.array([[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]], dtype=bool), 100),
+                  (3, 8)),
+                 (("find_cycle", np.array([[1]], dtype=bool), 100), (1, 1)),
+                 (("find_cycle", "gameoflife.gamegrid(5, 5, [(np.ones((1, 3), dtype=bool), 2, 1)])", 100), (0, 2)),
+                 (("find_cycle", "gameoflife.gamegrid(10, 10, [(gameoflife.glider, 0, 0)])", 100), (0, 40)),
+                 (("find_cycle", "gameoflife.gamegrid(10, 10, [(gameoflife.glider, 0, 0)])", 100, 20), None),
+             ])
+
+    register("j", "Aufgabe 7j: Export ohne Anzeige", 1, "export",
+             imports=["numpy", "gameoflife", "sys", "zlib", "struct", "argparse", "PIL"],
+             calls=[
+                 (("len", "list(frames(np.zeros((2, 2), dtype=bool), 5))"), 6),
+                 (("encode_png(np.array([[1, 0, 1], [0, 1, 0]], dtype=bool)).startswith", b"\x89PNG\r\n\x1a\n"), True),
+                 (("zlib.decompress", "encode_png(np.array([[1, 0, 1], [0, 1, 0]], dtype=bool))[59:-16]"),
+                  b"\x00\xa0\x00\x40"),
+             ])
+
+    register("k", "Aufgabe 7k: Hintergrundberechnung", 1, "pipeline",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation", "gameoflife", "threading"],
+             calls=[
+                 (("len", "FramePipeline(np.eye(4, dtype=bool), 3).frames"), 3),
+                 (("FramePipeline(np.eye(4, dtype=bool), 2).get", "np.zeros((4, 4), dtype=bool)"), None),
+                 (("getattr", "FramePipeline(np.eye(4, dtype=bool), 2)", "'overwrite'"), False),
+             ])
+
+    register("l", "Aufgabe 7l: Regeln in B/S-Notation", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("str", "Rule.parse('B36/S23')"), "B36/S23"),
+                 (("str", "Rule.parse('23/36')"), "B36/S23"),
+                 (("str", "Rule.parse('b2/s')"), "B2/S"),
+                 (("Rule.parse('S23/B3').__eq__", "conway"), True),
+                 (("next_step", np.array([[1, 1, 1, 0, 0], [0, 0, 0, 0, 0], [1, 1, 1, 0, 0], [0, 0, 0, 0, 0],
+                                          [0, 0, 0, 0, 0]], dtype=bool), "highlife"),
+                  np.array([[0, 1, 0, 0, 0], [0, 1, 0, 0, 0], [0, 1, 0, 0, 0], [0, 1, 0, 0, 0], [0, 1, 0, 0, 0]],
+                           dtype=bool)),
+                 (("next_step", np.array([[0, 0, 0, 0], [0, 1, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0]], dtype=bool), "seeds"),
+                  np.array([[0, 1, 1, 0], [0, 0, 0, 0], [0, 1, 1, 0], [0, 0, 0, 0]], dtype=bool)),
+                 (("conway.lookup", "np.array([3, 3, 2, 2], dtype=np.uint8)", "np.array([0, 1, 0, 1])"),
+                  np.array([True, True, False, False])),
+                 (("next_step", np.array([[0, 0, 0, 0], [0, 1, 1, 1], [0, 0, 0, 0], [0, 0, 0, 0]]), "highlife"),
+                  np.array([[0, 0, 1, 0], [0, 0, 1, 0], [0, 0, 1, 0], [0, 0, 0, 0]])),
+             ])
+
+    register("m", "Aufgabe 7m: Blocktabelle", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("len", "conway.block_table()"), 65536),
+                 (("int", "conway.block_table()[0b0000011000100000]"), 0b1111),
+                 (("next_step", np.array([[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 0]], dtype=bool),
+                   "conway", "'block'"),
+                  np.array([[1, 0, 1, 0], [0, 0, 0, 0], [1, 0, 1, 1], [0, 1, 1, 1]], dtype=bool)),
+                 (("next_step", np.array([[0, 1, 0, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 0, 0]], dtype=bool),
+                   "conway", "'block'"),
+                  np.array([[1, 0, 0, 0, 0], [1, 0, 1, 0, 0], [1, 0, 1, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "next_step(np.tri(9, 13, 4, dtype=bool), highlife, 'block')",
+                   "next_step(np.tri(9, 13, 4, dtype=bool), highlife)"), True),
+             ])
+
+    register("n", "Aufgabe 7n: Viele Muster platzieren", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("add_entities", np.zeros((3, 4), dtype=bool), np.array([[1, 1]], dtype=bool), [0, 2, 1], [0, 2, 1]),
+                  np.array([[1, 1, 0, 0], [0, 1, 1, 0], [0, 0, 1, 1]], dtype=bool)),
+                 (("add_entities", np.zeros((2, 3), dtype=bool), np.array([[1, 1]], dtype=bool), [0, 0, 1], [0, 1, 2],
+                   "'xor'", True),
+                  np.array([[1, 0, 1], [1, 0, 1]], dtype=bool)),
+                 (("add_entities", np.zeros((2, 3), dtype=bool), np.array([[1, 0], [1, 0]], dtype=bool), [0], [1]),
+                  np.array([[0, 1, 0], [0, 1, 0]], dtype=bool)),
+                 (("gamegrid", 4, 3, [(np.array([[1, 0, 1]], dtype=bool), 2, 2)], True),
+                  np.array([[0, 0, 0, 0], [0, 0, 0, 0], [1, 0, 1, 0]], dtype=bool)),
+                 (("np.array_equal", "gamegrid(6, 6, [(glider, 0, 0), (glider, 3, 3)])",
+                   "add_entity(add_entity(np.zeros((6, 6), dtype=bool), glider, 0, 0), glider, 3, 3)"), True),
+             ])
+
+    # Speichert ein Spielfeld, lädt es wieder und vergleicht.
+    round_trip = ("(lambda path, grid, compress, mmap: (save(path, grid, 7, gameoflife.highlife, compress), "
+                  "(lambda result: (np.array_equal(result[0], grid), result[1], str(result[2])))("
+                  "load(path, mmap)))[1])")
+    small = "gameoflife.gamegrid(13, 11, [(gameoflife.glider, 7, 10)])"
+    # Mehr als band_cells Zellen, also mindestens zwei Bänder.
+    large = "np.random.default_rng(0).random((4100, 4099)) < 0.3"
+    register("o", "Aufgabe 7o: Sicherungsdateien", 1, "checkpoint",
+             imports=["numpy", "gameoflife", "zlib", "struct"],
+             calls=[
+                 (("_bands", 5, 3), [(0, 5)]),
+                 (("_unpack", "np.packbits(np.array([[1, 0, 1], [0, 1, 1]], dtype=bool), axis=1, bitorder='little')",
+                   2, 3),
+                  np.array([[1, 0, 1], [0, 1, 1]], dtype=bool)),
+                 ((round_trip, repr(os.path.join(scratch, "checkpoint0")), small, False, True), (True, 7, "B36/S23")),
+                 ((round_trip, repr(os.path.join(scratch, "checkpoint1")), small, False, False), (True, 7, "B36/S23")),
+                 ((round_trip, repr(os.path.join(scratch, "checkpoint2")), small, True, True), (True, 7, "B36/S23")),
+                 ((round_trip, repr(os.path.join(scratch, "checkpoint3")), small, True, False), (True, 7, "B36/S23")),
+                 ((round_trip, repr(os.path.join(scratch, "checkpoint4")), large, True, True), (True, 7, "B36/S23")),
+                 ((round_trip, repr(os.path.join(scratch, "checkpoint5")), large, False, True), (True, 7, "B36/S23")),
+             ])
+
+    register("p", "Aufgabe 7p: Zeitreise durch die Generationen", 1, "history",
+             imports=["numpy", "gameoflife", "collections"],
+             calls=[
+                 (("np.array_equal", "(lambda h: (h.step(5), h.seek(3))[1])(History(gameoflife.gamegrid(8, 8, "
+                   "[(gameoflife.glider, 1, 1)]), interval=2))",
+                   "gameoflife.add_entity(np.zeros((8, 8), dtype=bool), "
+                   "np.array([[1, 0, 0], [0, 1, 1], [1, 1, 0]], dtype=bool), 2, 2)"), True),
+                 (("np.array_equal", "(lambda h: (h.step(5), h.seek(0))[1])(History(gameoflife.gamegrid(8, 8, "
+                   "[(gameoflife.glider, 1, 1)]), interval=4))",
+                   "gameoflife.gamegrid(8, 8, [(gameoflife.glider, 1, 1)])"), True),
+             ])
+
+    register("q", "Aufgabe 7q: Unbegrenzte Ebene", 1, "sparselife",
+             imports=["numpy", "gameoflife"],
+             calls=[
+                 (("(lambda p: (p.add(np.ones((1, 3), dtype=bool), -1, 4), p.step(), p.window(-2, 4, 3, 3))[2])",
+                   "SparseLife(4)"),
+                  np.array([[0, 1, 0], [0, 1, 0], [0, 1, 0]], dtype=bool)),
+                 (("(lambda p: (p.add(gameoflife.glider, 0, 0), [p.step() for _ in range(400)], p.bounds())[2])",
+                   "SparseLife(8)"), (100, 100, 3, 3)),
+                 (("(lambda p: (p.add(np.ones((1, 2), dtype=bool), 0, 7), p.step(), len(p.chunks))[2])",
+                   "SparseLife(8)"), 0),
+             ])
+
+    register("r", "Aufgabe 7r: Mehrere Generationen ohne Kopien", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("advance", np.array([[0, 0, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0],
+                                        [0, 0, 0, 0, 0]], dtype=bool), 3),
+                  np.array([[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 0, 0],
+                            [0, 0, 0, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "advance(gamegrid(9, 7, [(glider, 1, 2)]), 4, conway, np.ones((7, 9), dtype=bool))",
+                   "gamegrid(9, 7, [(glider, 2, 3)])"), True),
+             ])
+
+    register("s", "Aufgabe 7s: Statistik pro Generation", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("(lambda stats: (advance(gamegrid(5, 5, [(np.ones((1, 3), dtype=bool), 2, 1)]), 2, stats=stats), "
+                   "stats.tolist())[1])", "np.zeros(2, dtype=statistics)"),
+                  [(3, 2, 2, 1, 2, 3, 1), (3, 2, 2, 2, 1, 1, 3)]),
+                 (("(lambda stats: (advance(gamegrid(8, 8, [(glider, 1, 1)]), 4, stats=stats), "
+                   "stats[['population', 'top', 'left']].tolist()[-1])[1])", "np.zeros(4, dtype=statistics)"),
+                  (5, 2, 2)),
+             ])
+
+    register("t", "Aufgabe 7t: Zählung zufälliger Suppen", 1, "census",
+             imports=["numpy", "gameoflife", "cycles", "os", "json", "time", "functools", "multiprocessing",
+                      "collections"],
+             calls=[
+                 (("name", "classify(gameoflife.glider)"), "glider"),
+                 (("name", "classify(np.ones((2, 2), dtype=bool))"), "block"),
+                 (("name", "classify(np.array([[1], [1], [1]], dtype=bool))"), "blinker"),
+                 (("len", "components(np.array([[1, 0, 1, 0, 0, 1]], dtype=bool))"), 3),
+                 (("len", "components(np.array([[1, 0, 1, 0, 0, 1]], dtype=bool), 2)"), 2),
+                 (("np.array_equal", "soup(7)", "soup(7)"), True),
+                 (("dict", "run_soup(5, board=64, max_board=100)"), {"overflow": 1}),
+                 (("(lambda objects: [objects['unknown'], objects['overflow'], objects['xs4_2x2_f0']])",
+                   "run_soup(5, board=64)"), [0, 0, 15]),
+             ])
+
+    register("u", "Aufgabe 7u: Spielfelder größer als der Arbeitsspeicher", 1, "outofcore",
+             imports=["numpy", "gameoflife", "os", "mmap", "time", "resource"],
+             calls=[
+                 (("band_rows", 8, 1000), 8),
+                 (("band_rows", 1000, 1000), 1),
+                 (("next_step", np.array([[0, 0, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0],
+                                          [0, 0, 0, 0, 0]], dtype=bool), "np.ones((5, 5), dtype=bool)",
+                   "gameoflife.conway", 1),
+                  np.array([[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 0, 0],
+                            [0, 0, 0, 0, 0]], dtype=bool)),
+                 (("(lambda big, target: (big.__setitem__(slice(None), np.eye(20, dtype=bool)), "
+                   "next_step(big[5:15], target[8:18]), np.array_equal(target[8:18], "
+                   "gameoflife.next_step(np.array(big[5:15]))), bool(target[:8].any()))[2:])",
+                   "create({!r}, 20, 20)".format(os.path.join(scratch, "big.grid")),
+                   "create({!r}, 20, 20)".format(os.path.join(scratch, "target.grid"))), (True, False)),
+             ])
+
+    register("v", "Aufgabe 7v: Randbedingungen", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("pad", np.array([[1, 0], [0, 0]], dtype=bool), "'klein'"),
+                  np.array([[0, 0, 0, 1], [0, 1, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]], dtype=bool)),
+                 (("next_step", np.array([[1, 1, 1], [0, 0, 0], [0, 0, 0], [0, 0, 0]], dtype=bool), "conway",
+                   "'count'", "'dead'"),
+                  np.array([[0, 1, 0], [0, 1, 0], [0, 0, 0], [0, 0, 0]], dtype=bool)),
+                 (("next_step", np.array([[1, 1, 1], [0, 0, 0], [0, 0, 0], [0, 0, 0]], dtype=bool), "conway",
+                   "'count'", "'reflect'"),
+                  np.array([[0, 0, 0], [1, 1, 1], [0, 0, 0], [0, 0, 0]], dtype=bool)),
+             ])
+    register("w", "Aufgabe 7w: Randbedingungen bitweise", 1, "packedlife",
+             imports=["numpy", "gameoflife"],
+             calls=[
+                 (("np.array_equal", "unpack(next_step(pack(gameoflife.gamegrid(70, 5, [(gameoflife.glider, 1, 67)])), "
+                   "70, 'klein'), 70)",
+                   "gameoflife.next_step(gameoflife.gamegrid(70, 5, [(gameoflife.glider, 1, 67)]), "
+                   "boundary='klein')"), True),
+             ])
+
+    register("x", "Aufgabe 7x: Detailstufen für große Spielfelder", 1, "viewer",
+             imports=["numpy", "gameoflife", "matplotlib", "matplotlib.cm", "matplotlib.animation", "threading"],
+             calls=[
+                 (("(lambda m: m.levels[1])", "Mipmap(np.array([[1, 1, 0], [1, 0, 0], [0, 0, 1]], dtype=bool))"),
+                  np.array([[3, 0], [0, 1]], dtype=np.uint8)),
+                 (("(lambda m: [len(m.levels), int(m.levels[-1][0, 0])])", "Mipmap(np.ones((5, 3), dtype=bool))"),
+                  [4, 15]),
+                 (("(lambda m: (m.grid.__setitem__((2, 2), False), m.update([8]), m.levels[1])[2])",
+                   "Mipmap(np.ones((3, 3), dtype=bool))"),
+                  np.array([[4, 2], [2, 0]], dtype=np.uint8)),
+                 (("(lambda m: m.render(0, 0, 8, 8, (4, 4)))", "Mipmap(np.ones((8, 8), dtype=bool))"),
+                  (np.ones((4, 4), dtype=np.float32), (0, 8, 8, 0))),
+                 (("(lambda level: [np.iinfo(Mipmap._dtype(k)).max >= 4 ** k for k in range(level)])", 24),
+                  [True] * 24),
+                 (("(lambda s: (s.start(), s.get(block=True), s.get(block=True), s.stop(), s.grid)[1:5:3])",
+                   "_Stepper(np.array([[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 0, 0], "
+                   "[0, 0, 0, 0, 0]], dtype=bool), gameoflife.next_step)"),
+                  (np.array([7, 11, 13, 17]),
+                   np.array([[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]],
+                            dtype=bool))),
+             ])
+
+    register("y", "Aufgabe 7y: Asynchrone Generationen", 1, "streaming",
+             imports=["numpy", "gameoflife", "asyncio"],
+             calls=[
+                 (("asyncio.run", "asyncio.wait_for(generations(gameoflife.gamegrid(5, 5, [(np.ones((1, 3), "
+                   "dtype=bool), 2, 1)]), changes=True).__anext__(), 10)"),
+                  (1, np.array([7, 11, 13, 17]))),
+                 (("(lambda item: item[1].flags.writeable)", "asyncio.run(asyncio.wait_for(generations("
+                   "np.zeros((3, 3), dtype=bool)).__anext__(), 10))"), False),
+                 (("(lambda b: (b.subscribe().close(), len(b.queues))[1])", "Broadcast(None)"), 0),
+                 (("(lambda b: (b.subscribe() and None, asyncio.run(asyncio.wait_for(b.run(), 10)))[1])",
+                   "Broadcast(generations(np.zeros((3, 3), dtype=bool), 5), 1)"), None),
+             ])
+
+    register("z", "Aufgabe 7z: Benchmarks", 1, "benchmark",
+             imports=["numpy", "gameoflife", "packedlife", "sys", "json", "math", "time", "platform", "argparse",
+                      "tracemalloc"],
+             calls=[
+                 (("len", "entities(64, 'glider', 0.3)"), 256),
+                 (("(lambda grid: grid.shape)", "workload(100, 'soup', 0.5)"), (100, 100)),
+                 (("np.array_equal", "_place(np.zeros((64, 64), dtype=bool), entities(64, 'c10orthogonal', 0.1))",
+                   "workload(64, 'c10orthogonal', 0.1)"), True),
+                 (("compare", {"results": [{"engine": "count", "size": 64, "seed": "soup", "density": 0.3,
+                                            "cells_per_second": 50.0}]},
+                   {"results": [{"engine": "count", "size": 64, "seed": "soup", "density": 0.3,
+                                 "cells_per_second": 100.0}]}),
+                  [(("count", 64, "soup", 0.3), 0.5)]),
+                 (("compare", {"results": [{"function": "gamegrid", "size": 64, "seed": "glider", "density": 0.3,
+                                            "seconds": 1.1}]},
+                   {"results": [{"function": "gamegrid", "size": 64, "seed": "glider", "density": 0.3,
+                                 "seconds": 1.0}]}), []),
+             ])
+
+    register("aa", "Aufgabe 7aa: Kachelweise Zeitschritte", 1, "gameoflife",
+             imports=["numpy", "matplotlib", "matplotlib.cm", "matplotlib.animation"],
+             calls=[
+                 (("tiled_step", np.array([[0, 0, 0, 0], [1, 1, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0]], dtype=bool),
+                   "conway", 1),
+                  np.array([[0, 1, 0, 0], [0, 1, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0]], dtype=bool)),
+                 (("np.array_equal", "next_step(gamegrid(37, 23, [(glider, 20, 3), (c10orthogonal, 5, 20)]), "
+                   "highlife, 'tiled')",
+                   "next_step(gamegrid(37, 23, [(glider, 20, 3), (c10orthogonal, 5, 20)]), highlife)"), True),
+             ])
+
+    register("ab", "Aufgabe 7ab: Musterdateien", 1, "patterns",
+             imports=["numpy", "gameoflife", "re", "sys"],
+             calls=[
+                 (("(lambda p: (_decode_rle(b'2o3b1', p, 0, 0), _decode_rle(b'12o2$3o!', p, 0, 5), p))",
+                   "np.zeros((3, 20), dtype=bool)"),
+                  ((0, 5, 4, False), (2, 3, 8, True),
+                   np.array([[1, 1, 0, 0, 0] + [1] * 12 + [0] * 3, [0] * 20, [1, 1, 1] + [0] * 17], dtype=bool))),
+                 (("_decode_rle", b"3b10", "np.zeros((1, 20), dtype=bool)", 0, 0), (0, 3, 2, False)),
+                 (("(lambda path: (open(path, 'w').write('#N glider\\nx = 3, y = 3, rule = B36/S23\\nbo$2bo$3\\no!'),"
+                   " (lambda result: (result[0], str(result[1])))(read_rle(path)))[1])", repr(os.path.join(scratch, "glider.rle"))),
+                  (np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=bool), "B36/S23")),
+                 (("(lambda path: (open(path, 'w').write('x = 3, y = 1, rule = B3/S23:T10,10\\n3o!'),"
+                   " str(read_rle(path)[1]))[1])", repr(os.path.join(scratch, "torus.rle"))), "B3/S23"),
+                 (("(lambda path: (open(path, 'w').write('x = 3, y = 1, rule = B2-a/S12\\n3o!'),"
+                   " read_rle(path)[1])[1])", repr(os.path.join(scratch, "hensel.rle"))), None),
+                 (("(lambda path: (open(path, 'w').write('x = 210000, y = 1\\n' + '12o3b' * 14000 + '!'),"
+                   " read_rle(path)[0].sum())[1])", repr(os.path.join(scratch, "long.rle"))), 168000),
+                 (("(lambda path: (open(path, 'w').write('!Name: glider\\n.O.\\n..*\\nOOO\\n'), read_cells(path))[1])",
+                   repr(os.path.join(scratch, "glider.cells"))),
+                  np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=bool)),
+             ])
+
+    try:
+        check_from_cmdline()
+        report()
+    finally:
+        shutil.rmtree(scratch)
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import gameoflife
+
+
+class Node:
+    """A canonical quadtree node of side length ``2 ** level``.
+
+    Nodes are only ever created through ``HashLife.join``, so two nodes
+    describing the same cells are always the same object and can be compared
+    and hashed by identity.
+    """
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population", "results")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+        self.results = {}
+
+
+class HashLife:
+    """A HashLife engine, i.e. a memoized quadtree simulation of the Game of
+    Life that can skip ahead exponentially many generations at once.
+
+    Args:
+        max_nodes (int): Size of the node cache. Whenever ``advance`` finds
+            more nodes in the cache, all nodes no longer reachable from the
+            current generation are garbage collected, see ``collect``.
+    """
+
+    def __init__(self, max_nodes=1000000):
+        self.max_nodes = max_nodes
+        self.nodes = {}
+        self.off = Node(None, None, None, None, 0, 0)
+        self.on = Node(None, None, None, None, 0, 1)
+        self.empty = [self.off]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def join(self, nw, ne, sw, se):
+        """Returns the canonical node made up of the four given quadrants."""
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is None:
+            node = Node(nw, ne, sw, se, nw.level + 1,
+                        nw.population + ne.population
+                        + sw.population + se.population)
+            self.nodes[key] = node
+        return node
+
+    def empty_node(self, level):
+        """Returns the canonical node of the given level without living
+        cells."""
+        while len(self.empty) <= level:
+            smaller = self.empty[-1]
+            self.empty.append(self.join(smaller, smaller, smaller, smaller))
+        return self.empty[level]
+
+    def centre(self, node):
+        """Returns the centre of ``node`` as a node of one level less."""
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def pad(self, node):
+        """Embeds ``node`` into the centre of an empty node of one level
+        more."""
+        empty = self.empty_node(node.level - 1)
+        return self.join(self.join(empty, empty, empty, node.nw),
+                         self.join(empty, empty, node.ne, empty),
+                         self.join(empty, node.sw, empty, empty),
+                         self.join(node.se, empty, empty, empty))
+
+    def collect(self, roots):
+        """Garbage collects the node cache.
+
+        Only nodes reachable from ``roots`` survive, together with all
+        memoized results that point to surviving nodes.
+
+        Args:
+            roots (List[Node]): The nodes that are still in use.
+        """
+        alive = set(self.empty)
+        pending = list(roots)
+        while pending:
+            node = pending.pop()
+            if node.level == 0 or node in alive:
+                continue
+            alive.add(node)
+            pending += [node.nw, node.ne, node.sw, node.se]
+
+        self.nodes = {key: node for (key, node) in self.nodes.items()
+                      if node in alive}
+        for node in self.nodes.values():
+            node.results = {j: result for (j, result) in node.results.items()
+                            if result.level == 0 or result in alive}
+
+    def _life_4x4(self, node):
+        """Advances the 4x4 cells of ``node`` by one generation and returns
+        the resulting 2x2 centre."""
+        cells = np.zeros((4, 4), dtype=bool)
+        for (i, quadrant) in enumerate((node.nw, node.ne, node.sw, node.se)):
+            for (j, leaf) in enumerate((quadrant.nw, quadrant.ne,
+                                        quadrant.sw, quadrant.se)):
+                cells[2 * (i // 2) + j // 2, 2 * (i % 2) + j % 2] = \
+                    leaf.population
+
+        alive_neighbors = (np.lib.stride_tricks.sliding_window_view(
+            cells, (3, 3)).sum(axis=(2, 3)) - cells[1:3, 1:3])
+        alive = ((alive_neighbors == 3)
+                 | (cells[1:3, 1:3] & (alive_neighbors == 2)))
+
+        leaves = [self.on if cell else self.off for cell in alive.flat]
+        return self.join(*leaves)
+
+    def successor(self, node, j):
+        """Advances ``node`` by ``2 ** j`` generations.
+
+        Args:
+            node (Node): A node of level ``k >= 2``.
+            j (int): The logarithm of the number of generations,
+                ``0 <= j <= k - 2``.
+
+        Returns:
+            Node: The centre of ``node`` after ``2 ** j`` generations as a node
+            of level ``k - 1``.
+        """
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        result = node.results.get(j)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            join = self.join
+            (a, b, c, d) = (node.nw, node.ne, node.sw, node.se)
+
+            # Die neun überlappenden Teilquadrate der Ebene k - 1.
+            c1 = self.successor(join(a.nw, a.ne, a.sw, a.se), j)
+            c2 = self.successor(join(a.ne, b.nw, a.se, b.sw), j)
+            c3 = self.successor(join(b.nw, b.ne, b.sw, b.se), j)
+            c4 = self.successor(join(a.sw, a.se, c.nw, c.ne), j)
+            c5 = self.successor(join(a.se, b.sw, c.ne, d.nw), j)
+            c6 = self.successor(join(b.sw, b.se, d.nw, d.ne), j)
+            c7 = self.successor(join(c.nw, c.ne, c.sw, c.se), j)
+            c8 = self.successor(join(c.ne, d.nw, c.se, d.sw), j)
+            c9 = self.successor(join(d.nw, d.ne, d.sw, d.se), j)
+
+            if j < node.level - 2:
+                # Schritt bereits vollständig ausgeführt, nur noch Mitten
+                # zusammensetzen.
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw),
+                              join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw),
+                              join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                result = join(self.successor(join(c1, c2, c4, c5), j),
+                              self.successor(join(c2, c3, c5, c6), j),
+                              self.successor(join(c4, c5, c7, c8), j),
+                              self.successor(join(c5, c6, c8, c9), j))
+
+        node.results[j] = result
+        return result
+
+    def from_grid(self, grid):
+        """Converts a square game grid with a side length of ``2 ** k`` into
+        a node of level ``k``."""
+        size = grid.shape[0]
+        if size == 1:
+            return self.on if grid[0, 0] else self.off
+        if not grid.any():
+            return self.empty_node(size.bit_length() - 1)
+
+        half = size // 2
+        return self.join(self.from_grid(grid[:half, :half]),
+                         self.from_grid(grid[:half, half:]),
+                         self.from_grid(grid[half:, :half]),
+                         self.from_grid(grid[half:, half:]))
+
+    def to_grid(self, node, grid, top=0, left=0):
+        """Writes the living cells of ``node`` into ``grid``, where the
+        upper left corner of ``node`` is placed at position (top, left).
+        Cells outside of ``grid`` are ignored."""
+        size = 1 << node.level
+        rows, cols = grid.shape
+        if (node.population == 0 or top >= rows or left >= cols
+                or top + size <= 0 or left + size <= 0):
+            return grid
+        if node.level == 0:
+            grid[top, left] = True
+            return grid
+
+        half = size // 2
+        self.to_grid(node.nw, grid, top, left)
+        self.to_grid(node.ne, grid, top, left + half)
+        self.to_grid(node.sw, grid, top + half, left)
+        self.to_grid(node.se, grid, top + half, left + half)
+        return grid
+
+    def _collect_if_full(self, *roots):
+        if len(self.nodes) > self.max_nodes:
+            self.collect(roots)
+
+    def advance(self, grid, generations, wrap=True):
+        """Advances the game grid ``grid`` by ``generations`` time steps.
+
+        Args:
+            grid (np.ndarray): The game grid as created by
+                ``gameoflife.gamegrid``.
+            generations (int): The number of time steps.
+            wrap (bool): If ``True``, the grid is treated as a torus just like
+                in ``gameoflife.next_step``. Both sides of the grid must then
+                be powers of two. If ``False``, the grid is a window onto an
+                infinite plane that is dead outside of the grid initially.
+
+        Returns:
+            np.ndarray: The game grid after ``generations`` time steps.
+        """
+        if wrap:
+            new_grid = self._advance_torus(grid, generations)
+        else:
+            new_grid = self._advance_plane(grid, generations)
+
+        np.copyto(grid, new_grid)
+
+        return grid
+
+    def _advance_torus(self, grid, generations):
+        rows, cols = grid.shape
+        if rows & (rows - 1) or cols & (cols - 1):
+            raise ValueError("HashLife needs a grid whose sides are powers of "
+                             "two to wrap toroidally, got {}x{}."
+                             .format(rows, cols))
+
+        # Ein rechteckiger Torus ist periodisch, also darf er zu einem
+        # Quadrat aneinandergereiht werden.
+        size = max(rows, cols)
+        torus = self.from_grid(np.tile(grid, (size // rows, size // cols)))
+        k = torus.level
+
+        # Die 4x4-fache Kachelung des Torus hat als Mitte nach bis zu 2 ** k
+        # Generationen wieder den Torus als nordwestliches Viertel.
+        remaining = generations
+        while remaining > 0 and torus.population > 0:
+            j = min(remaining.bit_length() - 1, k)
+            quad = self.join(torus, torus, torus, torus)
+            torus = self.successor(self.join(quad, quad, quad, quad), j).nw
+            remaining -= 1 << j
+            self._collect_if_full(torus)
+
+        return self.to_grid(torus, np.zeros(grid.shape, dtype=bool))
+
+    def _advance_plane(self, grid, generations):
+        rows, cols = grid.shape
+        size = 1 << max(1, (max(rows, cols) - 1).bit_length())
+        cells = np.zeros((size, size), dtype=bool)
+        cells[:rows, :cols] = grid
+
+        node = self.from_grid(cells)
+        top = left = 0
+
+        remaining = generations
+        while remaining > 0 and node.population > 0:
+            j = remaining.bit_length() - 1
+
+            # Genug leeren Rand anfügen, damit sich das Muster in 2 ** j
+            # Generationen nicht über die Mitte hinaus ausbreiten kann.
+            while node.level < j + 2 or not self._inner_half(node):
+                offset = 1 << (node.level - 1)
+                (node, top, left) = (self.pad(node), top - offset,
+                                     left - offset)
+            offset = 1 << (node.level - 1)
+            (node, top, left) = (self.pad(node), top - offset, left - offset)
+
+            offset = 1 << (node.level - 2)
+            (node, top, left) = (self.successor(node, j), top + offset,
+                                 left + offset)
+            remaining -= 1 << j
+
+            # Leeren Rand wieder entfernen, damit die Knoten klein bleiben.
+            while self._inner_half(node):
+                offset = 1 << (node.level - 2)
+                (node, top, left) = (self.centre(node), top + offset,
+                                     left + offset)
+            self._collect_if_full(node)
+
+        return self.to_grid(node, np.zeros(grid.shape, dtype=bool), top, left)
+
+    def _inner_half(self, node):
+        """Checks whether all living cells of ``node`` lie in its centre."""
+        return node.level >= 2 and \
+            self.centre(node).population == node.population
+
+
+engine = HashLife()
+
+
+def advance(grid, generations, wrap=True):
+    """Advances the game grid ``grid`` by ``generations`` time steps using
+    the shared HashLife engine ``engine``.
+
+    Args:
+        grid (np.ndarray): The game grid as created by
+            ``gameoflife.gamegrid``.
+        generations (int): The number of time steps.
+        wrap (bool): If ``True``, the grid is treated as a torus just like in
+            ``gameoflife.next_step``. Both sides of the grid must then be
+            powers of two. If ``False``, the grid is a window onto an infinite
+            plane.
+
+    Returns:
+        np.ndarray: The game grid after ``generations`` time steps.
+    """
+    return engine.advance(grid, generations, wrap)
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(64, 64, [(gameoflife.glider, 13, 4),
+                                        (gameoflife.c10orthogonal, 25, 25)])
+    advance(grid, 1000000)
+    print(grid.sum(), len(engine))
+
+if __name__ == "__main__": main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+from collections import deque
+
+import numpy as np
+
+import gameoflife
+
+
+class History:
+    """Records the generations of a Game of Life run, so that any recorded
+    generation can be restored later.
+
+    Every ``interval`` generations a keyframe with one bit per cell is
+    stored. In between only the cells flipped by each time step are kept, so
+    the memory needed grows with the activity on the grid and not with its
+    area. At most ``capacity`` generations are held; older ones are dropped
+    a whole keyframe interval at a time.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        interval (int): The number of generations between two keyframes.
+        capacity (int): The number of generations that are kept at least.
+        step (Callable[[np.ndarray], np.ndarray]): The function that updates
+            the game grid by one time step.
+    """
+
+    def __init__(self, grid, interval=64, capacity=1024,
+                 step=gameoflife.next_step):
+        self.grid = grid
+        self.interval = interval
+        self.capacity = capacity
+        self.step_function = step
+        self.generation = 0
+
+        # Schlüsselbilder als (Generation, gepackte Zellen), dazu für jeden
+        # Zeitschritt ab dem ersten Schlüsselbild die geänderten Zellen.
+        self.keyframes = deque([(0, np.packbits(grid))])
+        self.deltas = deque()
+
+        self._previous = np.empty_like(grid)
+        self._changed = np.empty(grid.shape, dtype=bool)
+        self._index_type = np.int32 if grid.size < 2**31 else np.int64
+
+    @property
+    def first(self):
+        """int: The oldest generation that can still be restored."""
+        return self.keyframes[0][0]
+
+    @property
+    def nbytes(self):
+        """int: The number of bytes used by keyframes and change lists."""
+        return (sum(packed.nbytes for (_, packed) in self.keyframes)
+                + sum(delta.nbytes for delta in self.deltas))
+
+    def step(self, steps=1):
+        """Updates the game grid ``steps`` times and records every time step.
+
+        Args:
+            steps (int): The number of time steps.
+
+        Returns:
+            np.ndarray: The game grid after the time steps.
+        """
+        for _ in range(steps):
+            np.copyto(self._previous, self.grid)
+            self.step_function(self.grid)
+            np.not_equal(self._previous, self.grid, out=self._changed)
+            self.deltas.append(np.flatnonzero(self._changed).astype(
+                self._index_type))
+            self.generation += 1
+
+            if self.generation % self.interval == 0:
+                self.keyframes.append((self.generation,
+                                       np.packbits(self.grid)))
+                # Älteste Periode verwerfen, sobald die übrigen genügen.
+                while (len(self.keyframes) > 1 and self.generation
+                       - self.keyframes[1][0] >= self.capacity):
+                    (start, _) = self.keyframes.popleft()
+                    for _ in range(self.keyframes[0][0] - start):
+                        self.deltas.popleft()
+
+        return self.grid
+
+    def seek(self, generation, out=None):
+        """Restores a recorded generation. The game grid itself is left
+        untouched.
+
+        The generation is rebuilt from the closest keyframe or from the
+        current game grid, whichever needs fewer change lists.
+
+        Args:
+            generation (int): The generation to restore, between ``first``
+                and the current generation.
+            out (np.ndarray): The array the generation is written into. A new
+                array is created if it is ``None``.
+
+        Returns:
+            np.ndarray: The game grid of the given generation.
+        """
+        if not self.first <= generation <= self.generation:
+            raise IndexError("Generation {} is not recorded, only {} to {} "
+                             "are.".format(generation, self.first,
+                                           self.generation))
+        if out is None:
+            out = np.empty_like(self.grid)
+        cells = out.reshape(-1)
+
+        (start, packed) = self.keyframes[(generation - self.first)
+                                         // self.interval]
+        if generation - start <= self.generation - generation:
+            cells[:] = np.unpackbits(packed, count=cells.size).view(bool)
+            for t in range(start, generation):
+                cells[self.deltas[t - self.first]] ^= True
+        else:
+            # Die Änderungen sind ihr eigenes Inverses, also rückwärts
+            # vom aktuellen Zustand aus anwenden.
+            np.copyto(out, self.grid)
+            for t in range(self.generation - 1, generation - 1, -1):
+                cells[self.deltas[t - self.first]] ^= True
+
+        return out
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(400, 400, [(gameoflife.glider, 13, 4),
+                                          (gameoflife.c10orthogonal, 25, 25)])
+    history = History(grid)
+    history.step(500)
+    print(history.first, history.generation, history.nbytes)
+    print(history.seek(history.first + 100).sum(), history.seek(490).sum())
+
+if __name__ == "__main__": main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+import os
+import mmap
+import time
+import resource
+
+import numpy as np
+
+import gameoflife
+
+
+# Ungefährer Speicherbedarf pro Zelle eines Bandes: das Band selbst, die
+# gepolsterte Kopie und die Zwischenergebnisse von padded_step.
+bytes_per_cell = 10
+
+
+def create(path, rows, cols):
+    """Creates an empty game grid in the file ``path``.
+
+    Args:
+        path (str): Path of the file. An existing file is overwritten.
+        rows (int): Height of the grid.
+        cols (int): Width of the grid.
+
+    Returns:
+        np.memmap: The game grid, mapped from the file.
+    """
+    return np.memmap(path, dtype=bool, mode="w+", shape=(rows, cols))
+
+def band_rows(cols, memory):
+    """Returns the number of rows per band so that the working set of
+    ``next_step`` stays within ``memory`` bytes.
+
+    Args:
+        cols (int): Width of the grid.
+        memory (int): The memory available for one band in bytes.
+
+    Returns:
+        int: The number of rows per band, at least one.
+    """
+    return max(1, memory // (bytes_per_cell * (cols + 2)) - 2)
+
+class _Rows:
+    """Reads and writes whole rows of a game grid. Rows of memory-mapped
+    grids are transferred with plain file operations, so they never become
+    part of the resident memory of the process."""
+
+    def __init__(self, grid, mode):
+        self.grid = grid
+        self.cols = grid.shape[1]
+        # Ausschnitte erben filename und offset der ganzen Abbildung, liegen
+        # aber anderswo in der Datei. Nur die ganze Abbildung selbst wird
+        # daher über die Datei gelesen und geschrieben.
+        if (isinstance(grid, np.memmap) and grid.filename is not None
+                and isinstance(grid.base, mmap.mmap)
+                and grid.flags.c_contiguous):
+            self.file = open(grid.filename, mode)
+        else:
+            self.file = None
+
+    def read(self, top, out):
+        if self.file is None:
+            out[...] = self.grid[top:top + len(out)]
+        else:
+            self.file.seek(self.grid.offset + top * self.cols)
+            self.file.readinto(out.view(np.uint8).data)
+
+    def write(self, top, rows):
+        if self.file is None:
+            self.grid[top:top + len(rows)] = rows
+        else:
+            self.file.seek(self.grid.offset + top * self.cols)
+            self.file.write(rows.view(np.uint8).data)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+def next_step(source, target, rule=gameoflife.conway, memory=64 << 20):
+    """Computes the next generation of the game grid ``source`` and writes
+    it to ``target``.
+
+    The grid is processed in horizontal bands, each read together with the
+    rows above and below it. Both grids are usually memory-mapped files
+    created by ``create``; their rows are streamed with plain reads and
+    writes instead of through the mapping, so neither generation has to fit
+    into memory. The grid is treated as a torus.
+
+    Args:
+        source (np.ndarray): The game grid, e.g. an ``np.memmap``.
+        target (np.ndarray): An array of the same shape for the next
+            generation.
+        rule (gameoflife.Rule): The rule of the game.
+        memory (int): The maximum working set in bytes, see ``band_rows``.
+
+    Returns:
+        np.ndarray: ``target``, holding the next generation.
+    """
+    rows, cols = source.shape
+    size = min(rows, band_rows(cols, memory))
+    band = np.empty((size + 2, cols), dtype=bool)
+    padded = np.empty((size + 2, cols + 2), dtype=bool)
+
+    # Alle Schreibzugriffe über die Abbildung sollen in der Datei stehen.
+    for grid in (source, target):
+        if isinstance(grid, np.memmap):
+            grid.flush()
+
+    reader, writer = _Rows(source, "rb"), _Rows(target, "r+b")
+    try:
+        for top in range(0, rows, size):
+            bottom = min(top + size, rows)
+            height = bottom - top
+
+            # Band samt Halo-Zeilen lesen und seitlich toroidal fortsetzen.
+            reader.read((top - 1) % rows, band[:1])
+            reader.read(top, band[1:height + 1])
+            reader.read(bottom % rows, band[height + 1:height + 2])
+            padded[:height + 2, 1:-1] = band[:height + 2]
+            padded[:height + 2, 0] = band[:height + 2, -1]
+            padded[:height + 2, -1] = band[:height + 2, 0]
+
+            writer.write(top, gameoflife.padded_step(padded[:height + 2],
+                                                     rule))
+    finally:
+        reader.close()
+        writer.close()
+
+    return target
+
+def next_steps(source, target, steps, rule=gameoflife.conway,
+               memory=64 << 20):
+    """Updates the game grid ``source`` ``steps`` times, alternating between
+    ``source`` and ``target`` as input and output.
+
+    Args:
+        source (np.ndarray): The game grid, e.g. an ``np.memmap``.
+        target (np.ndarray): A second array of the same shape.
+        steps (int): The number of time steps.
+        rule (gameoflife.Rule): The rule of the game.
+        memory (int): The maximum working set in bytes, see ``band_rows``.
+
+    Returns:
+        np.ndarray: ``source`` or ``target``, whichever holds the last
+        generation.
+    """
+    for _ in range(steps):
+        next_step(source, target, rule, memory)
+        source, target = target, source
+    return source
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    rows = cols = 8000
+    steps = 5
+    source = create("source.grid", rows, cols)
+    target = create("target.grid", rows, cols)
+    rng = np.random.default_rng(0)
+    for top in range(0, rows, 1000):
+        source[top:top + 1000] = rng.random((1000, cols)) < 0.3
+    grid = np.array(source)
+
+    start = time.perf_counter()
+    result = next_steps(source, target, steps, memory=16 << 20)
+    print("memmap: {:.1f} Mcells/s".format(
+        rows * cols * steps / (time.perf_counter() - start) / 1e6))
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        gameoflife.next_step(grid)
+    print("memory: {:.1f} Mcells/s".format(
+        rows * cols * steps / (time.perf_counter() - start) / 1e6))
+
+    print(np.array_equal(grid, result),
+          resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024, "MB")
+    del source, target, result
+    os.remove("source.grid")
+    os.remove("target.grid")
+
+if __name__ == "__main__": main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import gameoflife
+
+
+# Anzahl der Zeilen, die next_step gleichzeitig bearbeitet. Begrenzt den
+# Speicher für Zwischenergebnisse unabhängig von der Größe des Spielfelds.
+band_rows = 256
+
+
+def pack(grid):
+    """Packs a ``bool`` game grid into 64 cells per machine word.
+
+    Cell ``(i, j)`` is stored in bit ``j % 64`` (least significant bit first)
+    of word ``(i, j // 64)``. Unused bits in the last word of a row are zero.
+
+    Args:
+        grid (np.ndarray): The game grid as created by
+            ``gameoflife.gamegrid``.
+
+    Returns:
+        np.ndarray: An (h, ceil(w / 64)) numpy-array of type ``uint64``.
+    """
+    rows, cols = grid.shape
+    words = -(-cols // 64)
+
+    packed_bytes = np.zeros((rows, 8 * words), dtype=np.uint8)
+    packed_bytes[:, :-(-cols // 8)] = np.packbits(grid, axis=1,
+                                                  bitorder='little')
+
+    return packed_bytes.view('<u8')
+
+def unpack(packed, w):
+    """Converts a packed game grid back into a ``bool`` game grid.
+
+    Args:
+        packed (np.ndarray): The packed game grid as created by ``pack``.
+        w (int): Width of the game grid in cells.
+
+    Returns:
+        np.ndarray: The game grid modelled as an (h, w) numpy-array of type
+        ``bool``.
+    """
+    packed_bytes = np.ascontiguousarray(packed, dtype='<u8').view(np.uint8)
+    cells = np.unpackbits(packed_bytes, axis=1, count=w, bitorder='little')
+
+    return cells.view(bool)
+
+def _halo(packed, w, boundary):
+    """Returns the cells beyond the left and right border of every row of
+    ``packed``, in bit 0 of one word per row, see ``gameoflife.pad``."""
+    last = (w - 1) // 64, np.uint64((w - 1) % 64)
+    first_cells = packed[:, 0] & np.uint64(1)
+    last_cells = (packed[:, last[0]] >> last[1]) & np.uint64(1)
+
+    if boundary == "dead":
+        return np.zeros_like(first_cells), np.zeros_like(first_cells)
+    elif boundary == "reflect":
+        return first_cells, last_cells
+    elif boundary == "klein":
+        return last_cells[::-1].copy(), first_cells[::-1].copy()
+    return last_cells, first_cells
+
+def _shift_west(words, w, halo):
+    """Returns the western neighbour of every cell of the packed rows
+    ``words``, i.e. bit ``j`` of the result holds cell ``j - 1``. Cell 0
+    gets the cell beyond the left border from ``halo``."""
+    shifted = words << np.uint64(1)
+    shifted[:, 1:] |= words[:, :-1] >> np.uint64(63)
+    shifted[:, 0] |= halo
+    return shifted
+
+def _shift_east(words, w, halo):
+    """Returns the eastern neighbour of every cell of the packed rows
+    ``words``, i.e. bit ``j`` of the result holds cell ``j + 1``. The last
+    cell gets the cell beyond the right border from ``halo``."""
+    shifted = words >> np.uint64(1)
+    shifted[:, :-1] |= words[:, 1:] << np.uint64(63)
+
+    last = (w - 1) // 64, np.uint64((w - 1) % 64)
+    shifted[:, last[0]] &= ~(np.uint64(1) << last[1])
+    shifted[:, last[0]] |= halo << last[1]
+    return shifted
+
+def _step_rows(above, centre, below, w, west, east):
+    """Computes the next generation of the packed rows ``centre`` given the
+    rows ``above`` and ``below`` them, using bitwise full adders. ``west``
+    and ``east`` hold the halo cells of the three row sets."""
+    def add2(a, b):
+        return a ^ b, a & b
+
+    def add3(a, b, c):
+        partial = a ^ b
+        return partial ^ c, (a & b) | (partial & c)
+
+    # Summen der drei Zeilen: oben und unten je drei Zellen, mittig zwei.
+    ones_a, twos_a = add3(_shift_west(above, w, west[0]), above,
+                          _shift_east(above, w, east[0]))
+    ones_b, twos_b = add3(_shift_west(below, w, west[2]), below,
+                          _shift_east(below, w, east[2]))
+    ones_c, twos_c = add2(_shift_west(centre, w, west[1]),
+                          _shift_east(centre, w, east[1]))
+
+    # Bit 0 der Nachbarzahl, danach Bit 1 und die Überträge in Bit 2.
+    bit0, twos_d = add3(ones_a, ones_b, ones_c)
+    partial, fours_a = add3(twos_a, twos_b, twos_c)
+    bit1, fours_b = add2(partial, twos_d)
+
+    # Genau zwei oder drei Nachbarn: Bit 1 gesetzt, kein höheres Bit.
+    # Bei drei Nachbarn (Bit 0) entsteht Leben, bei zwei bleibt es erhalten.
+    return bit1 & ~(fours_a | fours_b) & (bit0 | centre)
+
+def next_step(packed, w, boundary="torus"):
+    """Updates the packed game grid ``packed`` according to the game rules.
+
+    The result is identical to ``gameoflife.next_step`` on the unpacked grid,
+    including the boundary. The grid is processed in bands of ``band_rows``
+    rows, so the temporary memory stays small even for very large grids.
+
+    Args:
+        packed (np.ndarray): The packed game grid as created by ``pack``.
+        w (int): Width of the game grid in cells.
+        boundary (str): What lies beyond the border of the grid, see
+            ``gameoflife.pad``.
+
+    Returns:
+        np.ndarray: The packed game grid after one time step.
+    """
+    if boundary not in gameoflife.boundaries:
+        raise ValueError("Unknown boundary {!r}.".format(boundary))
+    rows = packed.shape[0]
+    west, east = _halo(packed, w, boundary)
+
+    # Zeilen jenseits des oberen und unteren Rands samt ihren Halozellen,
+    # bevor die Randzeilen überschrieben werden.
+    if boundary == "dead":
+        previous = (np.zeros_like(packed[:1]), west[:1], east[:1])
+        following = previous
+    elif boundary == "reflect":
+        previous = (packed[:1].copy(), west[:1], east[:1])
+        following = (packed[-1:].copy(), west[-1:], east[-1:])
+    else:
+        previous = (packed[-1:].copy(), west[-1:], east[-1:])
+        following = (packed[:1].copy(), west[:1], east[:1])
+
+    for start in range(0, rows, band_rows):
+        stop = min(start + band_rows, rows)
+        centre = packed[start:stop]
+        if stop < rows:
+            following_row = (packed[stop:stop + 1], west[stop:stop + 1],
+                             east[stop:stop + 1])
+        else:
+            following_row = following
+
+        above = [np.concatenate((part, rest)) for (part, rest) in
+                 zip(previous, (centre[:-1], west[start:stop - 1],
+                                east[start:stop - 1]))]
+        below = [np.concatenate((rest, part)) for (part, rest) in
+                 zip(following_row, (centre[1:], west[start + 1:stop],
+                                     east[start + 1:stop]))]
+
+        previous = (centre[-1:].copy(), west[stop - 1:stop],
+                    east[stop - 1:stop])
+        packed[start:stop] = _step_rows(
+            above[0], centre, below[0], w,
+            (above[1], west[start:stop], below[1]),
+            (above[2], east[start:stop], below[2]))
+
+    # Ungenutzte Bits am Zeilenende wieder auf null setzen.
+    if w % 64:
+        packed[:, -1] &= np.uint64((1 << (w % 64)) - 1)
+
+    return packed
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(100, 40, [(gameoflife.glider, 13, 4),
+                                         (gameoflife.c10orthogonal, 25, 70)])
+    packed = pack(grid)
+    for _ in range(50):
+        gameoflife.next_step(grid)
+        next_step(packed, 100)
+    print(np.array_equal(grid, unpack(packed, 100)))
+
+if __name__ == "__main__": main()
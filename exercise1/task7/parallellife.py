@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+import time
+import threading
+import multiprocessing as mp
+from multiprocessing import connection, shared_memory
+
+import numpy as np
+
+import gameoflife
+
+
+def strips(rows, processes):
+    """Splits ``rows`` rows into at most ``processes`` horizontal strips of
+    (almost) equal height.
+
+    Args:
+        rows (int): Number of rows of the game grid.
+        processes (int): Number of worker processes.
+
+    Returns:
+        List[Tuple[int, int]]: The first and one past the last row of each
+        strip.
+    """
+    processes = max(1, min(processes, rows))
+    bounds = [rows * k // processes for k in range(processes + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _worker(names, shape, top, bottom, steps, rule, barrier):
+    """Advances the rows ``top`` to ``bottom`` of the game grid held in the
+    two shared memory blocks ``names`` by ``steps`` time steps."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    grids = [np.ndarray(shape, dtype=bool, buffer=block.buf)
+             for block in blocks]
+    try:
+        rows, cols = shape
+        padded = np.empty((bottom - top + 2, cols + 2), dtype=bool)
+
+        for step in range(steps):
+            source = step % 2
+
+            # Streifen samt Halo-Zeilen der Nachbarstreifen einsammeln.
+            padded[0, 1:-1] = grids[source][(top - 1) % rows]
+            padded[1:-1, 1:-1] = grids[source][top:bottom]
+            padded[-1, 1:-1] = grids[source][bottom % rows]
+            padded[:, 0] = padded[:, -2]
+            padded[:, -1] = padded[:, 1]
+
+            grids[1 - source][top:bottom] = gameoflife.padded_step(padded,
+                                                                   rule)
+
+            # Niemand darf die nächste Generation beginnen, bevor alle
+            # Streifen dieser Generation geschrieben sind.
+            barrier.wait()
+    except threading.BrokenBarrierError:
+        # Ein anderer Prozess ist gescheitert und meldet den Fehler selbst.
+        pass
+    except BaseException:
+        # Sonst warten die übrigen Prozesse ewig an der Barriere.
+        barrier.abort()
+        raise
+    finally:
+        del grids
+        for block in blocks:
+            block.close()
+
+def next_steps(grid, steps, processes=None, rule=gameoflife.conway):
+    """Updates the game grid ``grid`` ``steps`` times using a pool of worker
+    processes, each of which computes one horizontal strip of the grid.
+
+    The cells live in shared memory, so the workers only read the halo rows
+    of their neighbours and synchronise at a barrier after each generation.
+    The result is identical to calling ``gameoflife.next_step`` ``steps``
+    times. If a worker fails, the barrier is broken so that all others stop
+    as well, and a ``RuntimeError`` is raised.
+
+    Args:
+        grid (np.ndarray): The game grid.
+        steps (int): The number of time steps.
+        processes (int): The number of worker processes. Defaults to the
+            number of CPUs.
+        rule (gameoflife.Rule): The rule of the game.
+
+    Returns:
+        np.ndarray: The game grid after ``steps`` time steps.
+    """
+    if steps <= 0:
+        return grid
+
+    bounds = strips(grid.shape[0], processes or mp.cpu_count())
+    blocks = [shared_memory.SharedMemory(create=True, size=max(1, grid.size))
+              for _ in range(2)]
+    grids = [np.ndarray(grid.shape, dtype=bool, buffer=block.buf)
+             for block in blocks]
+    workers = []
+    try:
+        np.copyto(grids[0], grid)
+
+        barrier = mp.Barrier(len(bounds))
+        workers = [mp.Process(target=_worker,
+                              args=([block.name for block in blocks],
+                                    grid.shape, top, bottom, steps, rule,
+                                    barrier))
+                   for (top, bottom) in bounds]
+        for worker in workers:
+            worker.start()
+
+        # Stirbt ein Prozess, ohne die Barriere selbst abzubrechen, z.B.
+        # durch ein Signal, übernimmt das der Elternprozess.
+        running = {worker.sentinel: worker for worker in workers}
+        while running:
+            for sentinel in connection.wait(list(running)):
+                worker = running.pop(sentinel)
+                worker.join()
+                if worker.exitcode != 0:
+                    barrier.abort()
+        if any(worker.exitcode != 0 for worker in workers):
+            raise RuntimeError("A worker process of next_steps failed.")
+
+        np.copyto(grid, grids[steps % 2])
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        # Die Sichten auf den geteilten Speicher müssen vor dem Schließen
+        # verschwinden.
+        del grids
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return grid
+
+def scaling(w, h, steps, processes=None):
+    """Measures the run time of ``next_steps`` for 1 to ``processes`` worker
+    processes on a random ``h`` x ``w`` game grid.
+
+    Args:
+        w (int): Width of the grid.
+        h (int): Height of the grid.
+        steps (int): The number of time steps per measurement.
+        processes (int): The largest number of worker processes. Defaults
+            to the number of CPUs.
+
+    Returns:
+        List[Tuple[int, float]]: The number of processes together with the
+        measured generations per second.
+    """
+    start_grid = np.random.default_rng(0).random((h, w)) < 0.3
+    results = []
+    for count in range(1, (processes or mp.cpu_count()) + 1):
+        grid = start_grid.copy()
+        start = time.perf_counter()
+        next_steps(grid, steps, count)
+        results.append((count, steps / (time.perf_counter() - start)))
+    return results
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    for (count, rate) in scaling(4096, 4096, 20):
+        print("{:3d} Prozesse: {:8.2f} Generationen/s".format(count, rate))
+
+if __name__ == "__main__": main()
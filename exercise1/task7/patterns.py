@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+import re
+import sys
+
+import numpy as np
+
+import gameoflife
+
+
+# Größe der Blöcke, in denen Musterdateien gelesen werden.
+chunk_size = 1 << 16
+
+# Eine Angabe der Topologie hinter der Regel wie in "B3/S23:T10,10" wird
+# übergangen.
+_rle_header = re.compile(rb"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)"
+                         rb"(?:\s*,\s*rule\s*=\s*([^\s,:]+))?", re.IGNORECASE)
+_whitespace = bytes(range(33))
+
+
+def _decode_rle(data, pattern, row, col):
+    """Decodes the RLE body ``data`` into ``pattern``, starting at cell
+    (row, col), with whole-array operations instead of a loop per run.
+
+    Returns:
+        Tuple[int, int, int, bool]: The cell the next run starts at, the
+        number of bytes of ``data`` that were consumed and whether the end
+        of the pattern ``!`` was reached.
+    """
+    codes = np.frombuffer(data, dtype=np.uint8)
+    end = np.flatnonzero(codes == ord("!"))
+    finished = len(end) > 0
+    if finished:
+        codes = codes[:end[0]]
+
+    digits = (codes >= ord("0")) & (codes <= ord("9"))
+    tags = np.flatnonzero(~digits)
+    consumed = int(end[0]) + 1 if finished else \
+        (int(tags[-1]) + 1 if len(tags) else 0)
+    if len(tags) == 0:
+        return row, col, consumed, finished
+
+    # Die Ziffern vor jedem Zeichen zu dessen Wiederholungszahl
+    # zusammensetzen, Stelle für Stelle von hinten.
+    lengths = np.diff(tags, prepend=-1) - 1
+    counts = np.zeros(len(tags), dtype=np.int64)
+    for k in range(1, int(lengths.max()) + 1):
+        present = lengths >= k
+        counts[present] += ((codes[tags[present] - k] - ord("0")).astype(
+            np.int64) * 10 ** (k - 1))
+    counts[lengths == 0] = 1
+
+    kinds = codes[tags]
+    newline = kinds == ord("$")
+    dead = (kinds == ord("b")) | (kinds == ord("."))
+
+    # Zeile und Spalte, an der jeder Lauf beginnt.
+    row_steps = np.where(newline, counts, 0)
+    rows_before = row + np.cumsum(row_steps) - row_steps
+    widths = np.where(newline, 0, counts)
+    cols_before = np.cumsum(widths) - widths
+    last_newline = np.maximum.accumulate(
+        np.where(newline, np.arange(len(tags)), -1))
+    after_newline = last_newline >= 0
+    cols_before[after_newline] -= cols_before[last_newline[after_newline]]
+    cols_before[~after_newline] += col
+
+    alive = ~(newline | dead)
+    run_rows, run_cols = rows_before[alive], cols_before[alive]
+    run_counts = counts[alive]
+    rows, cols = pattern.shape
+    if np.any((run_rows >= rows) | (run_cols + run_counts > cols)):
+        raise ValueError("Pattern exceeds the size given in its header.")
+
+    # Alle lebenden Zellen mit einer einzigen Zuweisung setzen.
+    starts = run_rows * cols + run_cols
+    offsets = np.cumsum(run_counts) - run_counts
+    cells = np.repeat(starts - offsets, run_counts)
+    cells += np.arange(len(cells))
+    pattern.reshape(-1)[cells] = True
+
+    row = int(rows_before[-1] + row_steps[-1])
+    col = int(cols_before[-1] + widths[-1])
+    return row, col, consumed, finished
+
+def read_rle(path):
+    """Reads a pattern in run length encoded (RLE) format.
+
+    The file is read in blocks of ``chunk_size`` bytes and each block is
+    decoded with whole-array operations straight into the resulting array,
+    so even very large patterns need no intermediate Python lists. Cells of
+    any state other than ``b`` count as living.
+
+    Args:
+        path (str): Path of the RLE file.
+
+    Returns:
+        Tuple[np.ndarray, Optional[gameoflife.Rule]]: The pattern as a numpy
+        array of type ``bool`` together with the rule given in the header,
+        or ``None`` if the header names no rule or one that is not in B/S
+        notation, like a named or a non-totalistic rule. A topology suffix
+        like ``:T10,10`` is ignored.
+    """
+    with open(path, "rb") as f:
+        line = f.readline()
+        while line.startswith(b"#") or not line.strip():
+            if not line:
+                raise ValueError("{} has no RLE header.".format(path))
+            line = f.readline()
+
+        header = _rle_header.match(line.strip())
+        if not header:
+            raise ValueError("Invalid RLE header {!r}.".format(line))
+        cols, rows = int(header.group(1)), int(header.group(2))
+        rule = header.group(3)
+        try:
+            rule = gameoflife.Rule.parse(rule.decode()) if rule else None
+        except ValueError:
+            rule = None
+
+        pattern = np.zeros((rows, cols), dtype=bool)
+        row = col = 0
+        rest = b""
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            # Zeilenumbrüche dürfen überall stehen, auch innerhalb einer Zahl.
+            data = rest + chunk.translate(None, _whitespace)
+            row, col, consumed, finished = _decode_rle(data, pattern, row, col)
+            if finished:
+                break
+            rest = data[consumed:]
+
+    return pattern, rule
+
+def read_cells(path):
+    """Reads a pattern in plaintext (``.cells``) format.
+
+    Lines starting with ``!`` are comments, ``O`` or ``*`` marks a living
+    cell and every other character a dead one. The file is read twice, once
+    for the size of the pattern and once for its cells, so no intermediate
+    Python lists are needed.
+
+    Args:
+        path (str): Path of the plaintext file.
+
+    Returns:
+        np.ndarray: The pattern as a numpy-array of type ``bool``.
+    """
+    rows = cols = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.startswith(b"!"):
+                rows += 1
+                cols = max(cols, len(line.rstrip(b"\r\n")))
+
+        pattern = np.zeros((rows, cols), dtype=bool)
+        f.seek(0)
+        row = 0
+        for line in f:
+            if not line.startswith(b"!"):
+                cells = np.frombuffer(line.rstrip(b"\r\n"), dtype=np.uint8)
+                pattern[row, :len(cells)] = ((cells == ord("O"))
+                                             | (cells == ord("*")))
+                row += 1
+
+    return pattern
+
+def load(path):
+    """Reads a pattern, choosing the format by the file extension.
+
+    Args:
+        path (str): Path of an ``.rle`` or ``.cells`` file.
+
+    Returns:
+        np.ndarray: The pattern as a numpy-array of type ``bool``.
+    """
+    if path.lower().endswith(".rle"):
+        return read_rle(path)[0]
+    elif path.lower().endswith(".cells"):
+        return read_cells(path)
+    raise ValueError("Unknown pattern format of {}.".format(path))
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    for path in sys.argv[1:]:
+        pattern = load(path)
+        print(path, pattern.shape, pattern.sum())
+
+if __name__ == "__main__": main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+import threading
+
+import numpy as np
+import matplotlib.cm as cm
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+
+import gameoflife
+
+
+class FramePipeline:
+    """Computes generations of the Game of Life in a background thread and
+    buffers them in a ring buffer of ``capacity`` frames.
+
+    Args:
+        grid (np.ndarray): The game grid. The background thread updates it
+            in place.
+        capacity (int): The number of frames in the ring buffer.
+        step (Callable[[np.ndarray], np.ndarray]): The function that updates
+            the game grid by one time step.
+        overwrite (bool): If ``False``, the simulation waits until a frame
+            has been consumed, so it runs at the pace of the consumer. If
+            ``True``, a full ring buffer drops its oldest frame instead, so
+            the simulation never waits, but runs unpaced and drops almost
+            every frame when the consumer is slower.
+    """
+
+    def __init__(self, grid, capacity=8, step=gameoflife.next_step,
+                 overwrite=False):
+        self.grid = grid
+        self.step = step
+        self.overwrite = overwrite
+
+        self.frames = np.empty((capacity,) + grid.shape, dtype=bool)
+        self.generations = np.zeros(capacity, dtype=int)
+        self.head = 0
+        self.count = 0
+
+        self.produced = 0
+        self.consumed = 0
+        self.dropped = 0
+
+        self.condition = threading.Condition()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._produce, daemon=True)
+
+    @property
+    def lag(self):
+        """int: The number of generations the consumer is behind the
+        simulation."""
+        return self.produced - self.consumed
+
+    def start(self):
+        """Starts the background thread."""
+        self.thread.start()
+
+    def stop(self):
+        """Stops the background thread and waits for it to finish."""
+        self.stopped.set()
+        with self.condition:
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def _produce(self):
+        capacity = len(self.frames)
+        generation = 0
+        while not self.stopped.is_set():
+            self.step(self.grid)
+            generation += 1
+
+            with self.condition:
+                while (not self.overwrite and self.count == capacity
+                       and not self.stopped.is_set()):
+                    self.condition.wait()
+                if self.stopped.is_set():
+                    return
+
+                if self.count == capacity:
+                    # Ältestes Bild verwerfen, die Simulation wartet nie.
+                    self.head = (self.head + 1) % capacity
+                    self.count -= 1
+                    self.dropped += 1
+
+                slot = (self.head + self.count) % capacity
+                self.frames[slot] = self.grid
+                self.generations[slot] = generation
+                self.count += 1
+                self.produced = generation
+                self.condition.notify_all()
+
+    def get(self, out, block=False):
+        """Takes the oldest ready frame out of the ring buffer.
+
+        Args:
+            out (np.ndarray): The array the frame is copied into.
+            block (bool): If ``True``, waits until a frame is ready.
+
+        Returns:
+            Optional[int]: The generation of the frame, or ``None`` if no
+            frame was ready.
+        """
+        with self.condition:
+            while block and self.count == 0 and not self.stopped.is_set():
+                self.condition.wait()
+            if self.count == 0:
+                return None
+
+            np.copyto(out, self.frames[self.head])
+            generation = int(self.generations[self.head])
+            self.head = (self.head + 1) % len(self.frames)
+            self.count -= 1
+            self.consumed = generation
+            self.condition.notify_all()
+
+        return generation
+
+
+def animate(grid, capacity=8, interval=50, overwrite=False):
+    """Animates the Game of Life using Matplotlib, while the generations are
+    computed in a background thread.
+
+    The animation only draws frames that are already computed and uses
+    blitting, so neither a slow time step nor a slow redraw stalls the
+    other. By default the simulation waits for the display whenever the
+    ring buffer is full, so it runs at most ``capacity`` generations ahead.
+    The number of dropped frames and the lag of the display behind the
+    simulation are shown in the lower left corner.
+
+    Args:
+        grid (np.ndarray): The game grid with which the animation starts.
+        capacity (int): The number of frames in the ring buffer.
+        interval (int): The delay between two frames in milliseconds.
+        overwrite (bool): See ``FramePipeline``.
+
+    Returns:
+        FramePipeline: The stopped pipeline, which holds the final
+        statistics.
+    """
+    pipeline = FramePipeline(grid, capacity, overwrite=overwrite)
+    display = grid.copy()
+
+    fig, ax = plt.subplots()
+    mat = ax.matshow(display, cmap=cm.gray_r)
+    text = ax.text(0.01, 0.01, "", transform=ax.transAxes, color="tab:red")
+
+    def update(_):
+        if pipeline.get(display) is not None:
+            mat.set_data(display)
+        text.set_text("dropped: {}  lag: {}".format(pipeline.dropped,
+                                                    pipeline.lag))
+        return mat, text
+
+    ani = animation.FuncAnimation(fig, update,
+                                  interval=interval,
+                                  blit=True,
+                                  cache_frame_data=False)
+    pipeline.start()
+    try:
+        plt.show()
+    finally:
+        pipeline.stop()
+
+    return pipeline
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(400, 400, [(gameoflife.glider, 13, 4),
+                                          (gameoflife.c10orthogonal, 25, 25)])
+    pipeline = animate(grid)
+    print(pipeline.dropped, pipeline.lag)
+
+if __name__ == "__main__": main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import gameoflife
+
+
+class SparseLife:
+    """The Game of Life on an unbounded plane.
+
+    The plane is divided into chunks of ``chunk_size`` x ``chunk_size``
+    cells, which are kept in a dictionary keyed by their chunk coordinates.
+    Only chunks with living cells are stored. A chunk is created as soon as
+    living cells reach the border of a neighbouring chunk and freed as soon
+    as it is empty, so patterns can travel arbitrarily far without ever
+    wrapping around.
+
+    Args:
+        chunk_size (int): Side length of the chunks.
+        rule (gameoflife.Rule): The rule of the game. Rules with birth on
+            zero neighbours would fill the whole plane and are not allowed.
+    """
+
+    def __init__(self, chunk_size=64, rule=gameoflife.conway):
+        if 0 in rule.birth:
+            raise ValueError("Rule {} fills the unbounded plane.".format(rule))
+        self.chunk_size = chunk_size
+        self.rule = rule
+        self.chunks = {}
+        self.generation = 0
+
+    @property
+    def population(self):
+        """int: The number of living cells."""
+        return sum(int(np.count_nonzero(chunk))
+                   for chunk in self.chunks.values())
+
+    def add(self, entity, y, x):
+        """Adds an entity to the plane. Its cells are combined with the cells
+        already on the plane by logical or, like in ``gameoflife.gamegrid``.
+
+        Args:
+            entity (np.ndarray): The entity, e.g. ``gameoflife.glider``.
+            y (int): The row of the upper left corner of the entity. May be
+                negative.
+            x (int): The column of the upper left corner of the entity. May
+                be negative.
+        """
+        size = self.chunk_size
+        rows, cols = entity.shape
+        for i in range(y // size, (y + rows - 1) // size + 1):
+            for j in range(x // size, (x + cols - 1) // size + 1):
+                # Ausschnitt des Musters, der in Chunk (i, j) fällt.
+                top, left = max(y, i * size), max(x, j * size)
+                bottom = min(y + rows, (i + 1) * size)
+                right = min(x + cols, (j + 1) * size)
+                part = entity[top - y:bottom - y, left - x:right - x]
+                if not part.any():
+                    continue
+                chunk = self.chunks.get((i, j))
+                if chunk is None:
+                    chunk = np.zeros((size, size), dtype=bool)
+                    self.chunks[(i, j)] = chunk
+                chunk[top - i * size:bottom - i * size,
+                      left - j * size:right - j * size] |= part
+
+    def _candidates(self):
+        """Returns the chunks that may contain living cells in the next
+        generation: every stored chunk and every neighbour that living
+        cells on the border of a stored chunk can reach."""
+        candidates = set(self.chunks)
+        for ((i, j), chunk) in self.chunks.items():
+            top, bottom = chunk[0].any(), chunk[-1].any()
+            left, right = chunk[:, 0].any(), chunk[:, -1].any()
+            if top:
+                candidates.add((i - 1, j))
+            if bottom:
+                candidates.add((i + 1, j))
+            if left:
+                candidates.add((i, j - 1))
+            if right:
+                candidates.add((i, j + 1))
+            if chunk[0, 0]:
+                candidates.add((i - 1, j - 1))
+            if chunk[0, -1]:
+                candidates.add((i - 1, j + 1))
+            if chunk[-1, 0]:
+                candidates.add((i + 1, j - 1))
+            if chunk[-1, -1]:
+                candidates.add((i + 1, j + 1))
+        return candidates
+
+    def _padded_chunk(self, i, j, padded):
+        """Writes chunk (i, j) together with its halo of one cell into
+        ``padded``."""
+        padded[...] = False
+        get = self.chunks.get
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                chunk = get((i + di, j + dj))
+                if chunk is None:
+                    continue
+                # Zeilen und Spalten des Nachbarn, die im Halo landen.
+                rows = slice(-1, None) if di < 0 else \
+                    (slice(None, 1) if di > 0 else slice(None))
+                cols = slice(-1, None) if dj < 0 else \
+                    (slice(None, 1) if dj > 0 else slice(None))
+                target_rows = slice(0, 1) if di < 0 else \
+                    (slice(-1, None) if di > 0 else slice(1, -1))
+                target_cols = slice(0, 1) if dj < 0 else \
+                    (slice(-1, None) if dj > 0 else slice(1, -1))
+                padded[target_rows, target_cols] = chunk[rows, cols]
+
+    def step(self):
+        """Updates the plane according to the game rules.
+
+        Returns:
+            SparseLife: The plane after one time step.
+        """
+        size = self.chunk_size
+        padded = np.empty((size + 2, size + 2), dtype=bool)
+
+        chunks = {}
+        for (i, j) in self._candidates():
+            self._padded_chunk(i, j, padded)
+            chunk = gameoflife.padded_step(padded, self.rule)
+            if chunk.any():
+                chunks[(i, j)] = chunk
+
+        self.chunks = chunks
+        self.generation += 1
+        return self
+
+    def bounds(self):
+        """Returns the smallest rectangle containing all living cells.
+
+        Returns:
+            Optional[Tuple[int, int, int, int]]: The top and left coordinates
+            and the height and width of the rectangle, or ``None`` if the
+            plane is empty.
+        """
+        if not self.chunks:
+            return None
+        size = self.chunk_size
+        top = left = np.inf
+        bottom = right = -np.inf
+        for ((i, j), chunk) in self.chunks.items():
+            rows = np.flatnonzero(chunk.any(axis=1))
+            cols = np.flatnonzero(chunk.any(axis=0))
+            top = min(top, i * size + rows[0])
+            bottom = max(bottom, i * size + rows[-1] + 1)
+            left = min(left, j * size + cols[0])
+            right = max(right, j * size + cols[-1] + 1)
+        return int(top), int(left), int(bottom - top), int(right - left)
+
+    def window(self, y, x, h, w):
+        """Exports a rectangular part of the plane as a game grid.
+
+        Args:
+            y (int): The row of the upper left corner of the window.
+            x (int): The column of the upper left corner of the window.
+            h (int): The height of the window.
+            w (int): The width of the window.
+
+        Returns:
+            np.ndarray: The cells of the window as a numpy-array of type
+            ``bool``.
+        """
+        size = self.chunk_size
+        grid = np.zeros((h, w), dtype=bool)
+        for i in range(y // size, (y + h - 1) // size + 1):
+            for j in range(x // size, (x + w - 1) // size + 1):
+                chunk = self.chunks.get((i, j))
+                if chunk is None:
+                    continue
+                top, left = max(y, i * size), max(x, j * size)
+                bottom = min(y + h, (i + 1) * size)
+                right = min(x + w, (j + 1) * size)
+                grid[top - y:bottom - y, left - x:right - x] = \
+                    chunk[top - i * size:bottom - i * size,
+                          left - j * size:right - j * size]
+        return grid
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    plane = SparseLife()
+    plane.add(gameoflife.glider, 13, 4)
+    plane.add(gameoflife.c10orthogonal, 25, 25)
+    for _ in range(1000):
+        plane.step()
+    print(plane.population, len(plane.chunks), plane.bounds())
+
+if __name__ == "__main__": main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import numpy as np
+
+import gameoflife
+
+
+async def generations(grid, steps=None, step=gameoflife.next_step,
+                      executor=None, changes=False):
+    """Yields the generations of the Game of Life for ``async for`` loops.
+
+    The time steps run in ``executor``, so the event loop stays responsive.
+    While the consumer works on one generation, the next one is already
+    computed, but never more than that, so a slow consumer slows down the
+    simulation instead of piling up generations.
+
+    Every generation is yielded as a read-only snapshot. It is copied once
+    and can be shared by any number of consumers, see ``Broadcast``.
+
+    Args:
+        grid (np.ndarray): The game grid. It is updated in place.
+        steps (Optional[int]): The number of time steps, or ``None`` to run
+            forever.
+        step (Callable[[np.ndarray], np.ndarray]): The function that updates
+            the game grid by one time step.
+        executor (concurrent.futures.Executor): The executor the time steps
+            run in, the default executor of the event loop if ``None``.
+        changes (bool): If ``True``, the flat indices of the cells that
+            changed since the previous generation are yielded instead of the
+            cells themselves.
+
+    Yields:
+        Tuple[int, np.ndarray]: The number of the generation together with
+        its snapshot or its changes.
+    """
+    loop = asyncio.get_running_loop()
+
+    def advance():
+        if steps is not None and generation >= steps:
+            return None
+        return loop.run_in_executor(executor, step, grid)
+
+    generation = 0
+    snapshot = grid.copy()
+    snapshot.flags.writeable = False
+    # Nächste Generation schon rechnen, während der Verbraucher noch mit
+    # der aktuellen beschäftigt ist.
+    pending = advance()
+    try:
+        if not changes:
+            yield generation, snapshot
+
+        while pending is not None:
+            await pending
+            generation += 1
+            previous, snapshot = snapshot, grid.copy()
+            snapshot.flags.writeable = False
+            pending = advance()
+
+            if changes:
+                flipped = np.flatnonzero(previous != snapshot)
+                flipped.flags.writeable = False
+                yield generation, flipped
+            else:
+                yield generation, snapshot
+    finally:
+        # Bricht der Verbraucher ab, darf kein Zeitschritt mehr laufen.
+        if pending is not None:
+            await pending
+
+class _Subscription:
+    """The items of a ``Broadcast`` for one consumer, see
+    ``Broadcast.subscribe``."""
+
+    def __init__(self, queues, capacity):
+        self.queues = queues
+        self.queue = asyncio.Queue(capacity)
+        queues.append(self.queue)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.queue is None:
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is Broadcast._end:
+            self.close()
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        self.close()
+
+    def close(self):
+        """Stops receiving items."""
+        if self.queue is None:
+            return
+        if self.queue in self.queues:
+            self.queues.remove(self.queue)
+        # Wartet run() gerade auf Platz in dieser Schlange, darf es nicht
+        # ewig hängen.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except RuntimeError:
+            # Die Ereignisschleife ist schon geschlossen.
+            pass
+
+class Broadcast:
+    """Distributes the items of one asynchronous iterator to several
+    consumers.
+
+    Every consumer gets the same objects, nothing is copied. Each consumer
+    has a queue of ``capacity`` items; as soon as one queue is full, the
+    source is not read any further until that consumer catches up.
+
+    Args:
+        source (AsyncIterator): The source, e.g. ``generations(grid)``.
+        capacity (int): The maximum number of items a consumer may lag
+            behind.
+    """
+
+    _end = object()
+
+    def __init__(self, source, capacity=4):
+        self.source = source
+        self.capacity = capacity
+        self.queues = []
+
+    def subscribe(self):
+        """Adds a consumer. Must be called before ``run``.
+
+        A consumer that stops early, e.g. with ``break``, no longer holds
+        up the others as soon as its iterator is closed with ``aclose()``
+        or is no longer referenced.
+
+        Returns:
+            AsyncIterator: The items of the source.
+        """
+        return _Subscription(self.queues, self.capacity)
+
+    async def run(self):
+        """Reads the source until it is exhausted and hands every item to
+        all consumers."""
+        try:
+            async for item in self.source:
+                for queue in list(self.queues):
+                    await queue.put(item)
+        finally:
+            for queue in list(self.queues):
+                await queue.put(self._end)
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(400, 400, [(gameoflife.glider, 13, 4),
+                                          (gameoflife.c10orthogonal, 25, 25)])
+
+    async def population(stream):
+        async for (generation, snapshot) in stream:
+            last = (generation, int(snapshot.sum()))
+        return last
+
+    async def activity(stream, delay):
+        total = 0
+        async for (generation, snapshot) in stream:
+            total += int(snapshot.sum())
+            await asyncio.sleep(delay)
+        return total
+
+    async def run():
+        broadcast = Broadcast(generations(grid, 200))
+        consumers = [population(broadcast.subscribe()),
+                     activity(broadcast.subscribe(), 0.001)]
+        return await asyncio.gather(broadcast.run(), *consumers)
+
+    print(asyncio.run(run()))
+
+if __name__ == "__main__": main()
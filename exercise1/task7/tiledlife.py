@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import gameoflife
+
+
+class TiledLife:
+    """A Game of Life stepper that only recomputes active tiles.
+
+    The game grid is divided into tiles of ``tile_size`` x ``tile_size``
+    cells. A tile can only change if a cell in it or in one of its eight
+    neighbouring tiles changed in the previous generation, so all other tiles
+    are skipped and cost nothing. The boundary is toroidal, just like in
+    ``gameoflife.next_step``.
+
+    Args:
+        grid (np.ndarray): The game grid as created by
+            ``gameoflife.gamegrid``. It is updated in place.
+        tile_size (int): Side length of the tiles.
+        rule (gameoflife.Rule): The rule of the game.
+    """
+
+    def __init__(self, grid, tile_size=64, rule=gameoflife.conway):
+        self.grid = grid
+        self.tile_size = tile_size
+        self.rule = rule
+        rows, cols = grid.shape
+        self.tile_rows = -(-rows // tile_size)
+        self.tile_cols = -(-cols // tile_size)
+
+        # Zu Beginn ist nichts über die Vorgeschichte bekannt, also ist
+        # jede Kachel aktiv.
+        self.active = {(i, j) for i in range(self.tile_rows)
+                       for j in range(self.tile_cols)}
+
+    def _padded_tile(self, i, j):
+        """Returns tile (i, j) together with its halo of one cell."""
+        rows, cols = self.grid.shape
+        top, left = i * self.tile_size, j * self.tile_size
+        bottom = min(top + self.tile_size, rows)
+        right = min(left + self.tile_size, cols)
+
+        if top > 0 and left > 0 and bottom < rows and right < cols:
+            return self.grid[top - 1:bottom + 1, left - 1:right + 1]
+
+        # Am Rand toroidal fortsetzen.
+        row_index = np.arange(top - 1, bottom + 1) % rows
+        col_index = np.arange(left - 1, right + 1) % cols
+        return self.grid[np.ix_(row_index, col_index)]
+
+    def step(self):
+        """Updates the game grid according to the game rules.
+
+        Returns:
+            np.ndarray: The game grid after one time step.
+        """
+        size = self.tile_size
+
+        # Erst alle aktiven Kacheln berechnen, dann zurückschreiben, damit
+        # jede Kachel den Zustand der vorherigen Generation sieht.
+        updates = []
+        for (i, j) in self.active:
+            new_tile = gameoflife.padded_step(self._padded_tile(i, j),
+                                              self.rule)
+            old_tile = self.grid[i * size:(i + 1) * size,
+                                 j * size:(j + 1) * size]
+            if not np.array_equal(new_tile, old_tile):
+                updates.append((i, j, new_tile))
+
+        self.active = set()
+        for (i, j, new_tile) in updates:
+            self.grid[i * size:(i + 1) * size,
+                      j * size:(j + 1) * size] = new_tile
+            for di in (-1, 0, 1):
+                for dj in (-1, 0, 1):
+                    self.active.add(((i + di) % self.tile_rows,
+                                     (j + dj) % self.tile_cols))
+
+        return self.grid
+
+
+def next_steps(grid, steps, tile_size=64, rule=gameoflife.conway):
+    """Updates the game grid ``grid`` ``steps`` times using a ``TiledLife``
+    stepper.
+
+    Args:
+        grid (np.ndarray): The game grid.
+        steps (int): The number of time steps.
+        tile_size (int): Side length of the tiles.
+        rule (gameoflife.Rule): The rule of the game.
+
+    Returns:
+        np.ndarray: The game grid after ``steps`` time steps.
+    """
+    stepper = TiledLife(grid, tile_size, rule)
+    for _ in range(steps):
+        stepper.step()
+    return grid
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = gameoflife.gamegrid(2000, 2000,
+                               [(gameoflife.glider, 13, 4),
+                                (gameoflife.c10orthogonal, 25, 25)])
+    stepper = TiledLife(grid)
+    for _ in range(100):
+        stepper.step()
+    print(grid.sum(), len(stepper.active))
+
+if __name__ == "__main__": main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+
+import threading
+
+import numpy as np
+import matplotlib.cm as cm
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+
+import gameoflife
+
+
+class Mipmap:
+    """A pyramid of population counts of a game grid.
+
+    Level ``k`` holds the number of living cells in every block of
+    ``2**k`` x ``2**k`` cells, level 0 is the game grid itself. Each level
+    uses the smallest unsigned integer type that can hold its counts. After
+    a time step only the blocks containing changed cells are recomputed,
+    level by level from the one below.
+
+    Args:
+        grid (np.ndarray): The game grid. It is referenced, not copied.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.levels = [grid]
+        while self.levels[-1].shape != (1, 1):
+            self.levels.append(self._reduce(self.levels[-1],
+                                            len(self.levels)))
+
+    @staticmethod
+    def _dtype(level):
+        """Returns the integer type for counts of up to ``4**level``."""
+        if level <= 3:
+            return np.uint8
+        if level <= 7:
+            return np.uint16
+        return np.uint32 if level <= 15 else np.uint64
+
+    @classmethod
+    def _reduce(cls, cells, level):
+        """Adds up blocks of 2x2 entries of ``cells``."""
+        rows, cols = cells.shape
+        counts = np.zeros((rows + rows % 2, cols + cols % 2),
+                          dtype=cls._dtype(level))
+        counts[:rows, :cols] = cells
+        return counts.reshape(counts.shape[0] // 2, 2,
+                              counts.shape[1] // 2, 2).sum(
+                                  axis=(1, 3), dtype=cls._dtype(level))
+
+    def update(self, cells):
+        """Recomputes the counts of all blocks containing the given cells.
+
+        Args:
+            cells (np.ndarray): The flat indices of the cells of the game
+                grid that changed, e.g. ``np.flatnonzero(old != new)`` or
+                the change lists of ``history.History``.
+        """
+        rows, cols = np.divmod(np.asarray(cells), self.grid.shape[1])
+        for k in range(1, len(self.levels)):
+            below, level = self.levels[k - 1], self.levels[k]
+            blocks = np.unique((rows >> 1) * level.shape[1] + (cols >> 1))
+            rows, cols = np.divmod(blocks, level.shape[1])
+
+            total = np.zeros(len(blocks), dtype=level.dtype)
+            for di in (0, 1):
+                for dj in (0, 1):
+                    child_rows, child_cols = 2 * rows + di, 2 * cols + dj
+                    valid = ((child_rows < below.shape[0])
+                             & (child_cols < below.shape[1]))
+                    total[valid] += below[child_rows[valid],
+                                          child_cols[valid]]
+            level[rows, cols] = total
+
+    def render(self, top, left, bottom, right, pixels):
+        """Returns the part of the game grid between rows ``top`` and
+        ``bottom`` and columns ``left`` and ``right`` at about screen
+        resolution.
+
+        The finest level whose blocks are at least as large as a pixel is
+        used, so the image is never much larger than ``pixels``, however
+        large the game grid is.
+
+        Args:
+            top (float): The first visible row.
+            left (float): The first visible column.
+            bottom (float): The row after the last visible one.
+            right (float): The column after the last visible one.
+            pixels (Tuple[int, int]): The height and width of the screen
+                area in pixels.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[float, float, float, float]]: The
+            density of living cells (0 to 1) of each block as ``float32``
+            and the extent of the image in cells as (left, right, bottom,
+            top), like ``extent`` of ``plt.imshow``.
+        """
+        rows, cols = self.grid.shape
+        cells_per_pixel = max((bottom - top) / max(pixels[0], 1),
+                              (right - left) / max(pixels[1], 1), 1)
+        k = min(int(np.log2(cells_per_pixel)), len(self.levels) - 1)
+        size = 1 << k
+
+        level = self.levels[k]
+        first_row = min(max(int(top) >> k, 0), level.shape[0] - 1)
+        first_col = min(max(int(left) >> k, 0), level.shape[1] - 1)
+        last_row = min(max(-(-int(np.ceil(bottom)) // size), first_row + 1),
+                       level.shape[0])
+        last_col = min(max(-(-int(np.ceil(right)) // size), first_col + 1),
+                       level.shape[1])
+
+        image = level[first_row:last_row, first_col:last_col].astype(
+            np.float32)
+        image *= 1 / (size * size)
+        extent = (first_col * size, min(last_col * size, cols),
+                  min(last_row * size, rows), first_row * size)
+        return image, extent
+
+
+class _Stepper:
+    """Computes the time steps of ``view`` in a background thread.
+
+    The thread updates its own copy of the game grid and hands over the
+    flat indices of the cells that changed, one generation at a time. It
+    only compares its copy with the displayed grid once the previous
+    changes have been applied to it, so the two never differ by more than
+    one generation, while the next time step is already being computed.
+
+    Args:
+        grid (np.ndarray): The displayed game grid. It is only changed by
+            ``get``.
+        step (Callable[[np.ndarray], np.ndarray]): The function that updates
+            the game grid by one time step.
+    """
+
+    def __init__(self, grid, step):
+        self.grid = grid
+        self.working = grid.copy()
+        self.step = step
+        self.changes = None
+
+        self.condition = threading.Condition()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._produce, daemon=True)
+
+    def start(self):
+        """Starts the background thread."""
+        self.thread.start()
+
+    def stop(self):
+        """Stops the background thread and waits for it to finish."""
+        self.stopped.set()
+        with self.condition:
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def _produce(self):
+        while not self.stopped.is_set():
+            self.step(self.working)
+
+            with self.condition:
+                while self.changes is not None and not self.stopped.is_set():
+                    self.condition.wait()
+                if self.stopped.is_set():
+                    return
+
+            # Solange keine Änderungen bereitliegen, fasst get() das
+            # angezeigte Spielfeld nicht an.
+            changes = np.flatnonzero(self.working != self.grid)
+            with self.condition:
+                self.changes = changes
+                self.condition.notify_all()
+
+    def get(self, block=False):
+        """Applies the changes of the next generation to the displayed game
+        grid.
+
+        Args:
+            block (bool): If ``True``, waits until the generation is ready.
+
+        Returns:
+            Optional[np.ndarray]: The flat indices of the changed cells, or
+            ``None`` if the next generation was not ready.
+        """
+        with self.condition:
+            while block and self.changes is None and not self.stopped.is_set():
+                self.condition.wait()
+            changes = self.changes
+        if changes is None:
+            return None
+
+        rows, cols = np.divmod(changes, self.grid.shape[1])
+        self.grid[rows, cols] = np.logical_not(self.grid[rows, cols])
+        with self.condition:
+            self.changes = None
+            self.condition.notify_all()
+        return changes
+
+
+def view(grid, step=gameoflife.next_step, interval=50):
+    """Shows the Game of Life on a large game grid using Matplotlib.
+
+    Instead of the whole grid only the visible part is drawn, at the
+    resolution of the screen, from a ``Mipmap`` of the grid. Panning and
+    zooming with the toolbar redraws just that part. The time steps and the
+    search for changed cells run in a background thread, so the window
+    only updates the blocks of the changed cells and stays responsive even
+    if a time step takes much longer than ``interval``.
+
+    Args:
+        grid (np.ndarray): The game grid with which the animation starts.
+        step (Optional[Callable[[np.ndarray], np.ndarray]]): The function
+            that updates the game grid by one time step, or ``None`` to only
+            view the grid.
+        interval (int): The delay between two frames in milliseconds.
+    """
+    rows, cols = grid.shape
+    mipmap = Mipmap(grid)
+
+    fig, ax = plt.subplots()
+    image = ax.imshow(np.zeros((1, 1), dtype=np.float32), cmap=cm.gray_r,
+                      vmin=0, vmax=1, interpolation="nearest",
+                      extent=(0, cols, rows, 0))
+    ax.set_xlim(0, cols)
+    ax.set_ylim(rows, 0)
+
+    def redraw(_=None):
+        left, right = sorted(ax.get_xlim())
+        top, bottom = sorted(ax.get_ylim())
+        box = ax.get_window_extent()
+        data, extent = mipmap.render(top, left, bottom, right,
+                                     (int(box.height), int(box.width)))
+        image.set_data(data)
+        image.set_extent(extent)
+
+    def update(_):
+        changes = stepper.get()
+        if changes is not None:
+            mipmap.update(changes)
+            redraw()
+        return image,
+
+    ax.callbacks.connect("xlim_changed", redraw)
+    ax.callbacks.connect("ylim_changed", redraw)
+    redraw()
+    if step is None:
+        plt.show()
+        return
+
+    stepper = _Stepper(grid, step)
+    ani = animation.FuncAnimation(fig, update,
+                                  interval=interval,
+                                  cache_frame_data=False)
+    stepper.start()
+    try:
+        plt.show()
+    finally:
+        stepper.stop()
+
+
+def main():
+    """The Main-Function of the programme. Is executed whenever this file is
+    executed at top level.
+
+    Hier kann beliebiger Testcode stehen, der bei der Korrektur vollständig
+    ignoriert wird.
+    """
+    grid = np.random.default_rng(0).random((4000, 4000)) < 0.2
+    view(grid)
+
+if __name__ == "__main__": main()